@@ -1,17 +1,57 @@
 """
 Advanced automation patterns and techniques with BrowserBot.
+
+Set BROWSERBOT_EXAMPLE_DELAY to change the pause between examples in seconds
+(default 3); use 0 to run them back to back, e.g. when benchmarking.
 """
 
 import asyncio
-from typing import List, Dict, Any
+import os
+import orjson
+from typing import List, Dict, Any, Optional
 from browserbot import BrowserAgent
 from browserbot.core.logger import get_logger
+from browserbot.core.ttl_cache import TTLCache
 from browserbot.core.error_handler import GlobalErrorHandler
+from browserbot.core.errors import BrowserError, ConfigurationError, NetworkError
 from browserbot.core.dead_letter_queue import get_dlq
-from browserbot.monitoring.observability import trace_operation
+from browserbot.core.retry import CircuitBreaker, CircuitBreakerConfig, RetryableOperation
+from browserbot.monitoring.observability import health_checker, trace_operation
+from browserbot.browser.shared_chromium import SharedChromium
+from browserbot.pool import BrowserAgentPool
 
 logger = get_logger(__name__)
 
+# Shared pool of warm agents for the parallel examples; all of them attach to a
+# single Chromium over CDP so parallel tasks only cost one browser process tree
+POOL = BrowserAgentPool(size=3, shared_browser=True)
+
+# Pause between examples in main()
+_DELAY = float(os.getenv("BROWSERBOT_EXAMPLE_DELAY", "3"))
+
+# Timestamp stamped on every processed pipeline item
+_PROCESSED_AT = "2024-01-01T00:00:00Z"
+
+
+def _measure(payload: Any, cache: Optional[Dict[int, int]] = None) -> int:
+    """Size of an extracted payload, serializing only non-string types once."""
+    if isinstance(payload, (str, bytes)):
+        return len(payload)
+    
+    key = id(payload)
+    if cache is not None and key in cache:
+        return cache[key]
+    
+    try:
+        # orjson serializes in C and gives the on-the-wire byte length
+        size = len(orjson.dumps(payload, default=str))
+    except orjson.JSONEncodeError:
+        size = len(str(payload))
+    
+    if cache is not None:
+        cache[key] = size
+    return size
+
 
 class AdvancedAutomationPatterns:
     """Advanced automation patterns and techniques."""
@@ -23,9 +63,14 @@ class AdvancedAutomationPatterns:
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.agent = BrowserAgent()
+        self.agent = await self._create_agent()
         return self
     
+    async def _create_agent(self) -> BrowserAgent:
+        """Create an agent attached to the shared Chromium used by the pool."""
+        shared = await SharedChromium.get()
+        return BrowserAgent(cdp_endpoint=shared.ws)
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self.agent:
@@ -44,55 +89,64 @@ class AdvancedAutomationPatterns:
             "https://httpbin.org/xml"
         ]
         
-        # Create multiple agents for parallel processing
-        agents = [BrowserAgent() for _ in range(3)]
+        # Define tasks for each URL; agents are borrowed from the shared pool.
+        # Ordinary failures come back as (url, "error", exc) so they don't cancel
+        # the other URLs; browser/configuration failures mean every sibling is
+        # doomed too, so they propagate and the TaskGroup cancels the rest.
+        async def process_url(url):
+            try:
+                async with POOL.acquire() as agent:
+                    result = await agent.execute_task(
+                        f"Go to {url} and extract any relevant data"
+                    )
+                return url, "result", result
+            except (BrowserError, ConfigurationError):
+                raise
+            except Exception as e:
+                return url, "error", e
+        
+        # The sentinel doubles as the output field name and selects the bucket,
+        # so no per-result type check is needed
+        successful_results = []
+        failed_results = []
+        append_to = {
+            "result": successful_results.append,
+            "error": failed_results.append
+        }
+        pending_dlq: List[Dict[str, Any]] = []
         
         try:
-            # Define tasks for each URL
-            async def process_url(agent, url):
-                return await agent.execute_task(
-                    f"Go to {url} and extract any relevant data"
-                )
-            
-            # Execute tasks in parallel
-            tasks = []
-            for i, url in enumerate(urls):
-                agent = agents[i % len(agents)]  # Round-robin agent assignment
-                tasks.append(process_url(agent, url))
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            successful_results = []
-            failed_results = []
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    failed_results.append({
-                        "url": urls[i],
-                        "error": str(result)
-                    })
-                else:
-                    successful_results.append({
-                        "url": urls[i],
-                        "result": result
-                    })
-            
-            logger.info(
-                "Parallel browsing completed",
-                successful_count=len(successful_results),
-                failed_count=len(failed_results)
-            )
-            
-            return {
-                "successful": successful_results,
-                "failed": failed_results
-            }
-            
+            # Execute tasks in parallel (the pool caps how many run at once) and
+            # classify each one as soon as it finishes
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(process_url(url)) for url in urls]
+                
+                for next_done in asyncio.as_completed(tasks):
+                    url, field, value = await next_done
+                    if field == "error":
+                        pending_dlq.append({
+                            "operation": "failed_request",
+                            "payload": {"url": url},
+                            "error": value,
+                            "max_retries": 3
+                        })
+                        value = str(value)
+                    append_to[field]({"url": url, field: value})
         finally:
-            # Clean up all agents
-            for agent in agents:
-                await agent.close()
+            # Hand failures to the DLQ in one write, even if the group was cancelled
+            if pending_dlq:
+                await self.dlq.add_batch(pending_dlq)
+        
+        logger.info(
+            "Parallel browsing completed",
+            successful_count=len(successful_results),
+            failed_count=len(failed_results)
+        )
+        
+        return {
+            "successful": successful_results,
+            "failed": failed_results
+        }
     
     @trace_operation("circuit_breaker_pattern")
     async def circuit_breaker_pattern_example(self):
@@ -107,15 +161,42 @@ class AdvancedAutomationPatterns:
             "https://httpbin.org/status/200",  # Success
         ]
         
+        # Failures destined for the DLQ, flushed in one batch after the loop
+        pending: List[Dict[str, Any]] = []
+        # Trip after two failures so the remaining URLs show the skip path;
+        # get_circuit_breaker's default threshold is more than this list has
+        breaker = self.error_handler.circuit_breakers.setdefault(
+            "unreliable_service_call",
+            CircuitBreaker(CircuitBreakerConfig(
+                failure_threshold=2,
+                recovery_timeout=60,
+                expected_exception=Exception
+            ))
+        )
+        
         for url in unreliable_urls:
+            # Don't spend a browser round-trip on a service we know is down
+            if breaker.is_open():
+                logger.info("Breaker open, skipping", url=url)
+                pending.append({
+                    "operation": "failed_request",
+                    "payload": {"url": url},
+                    "error": NetworkError(f"Circuit breaker open for {url}"),
+                    "max_retries": 3
+                })
+                continue
+            
             try:
                 result = await self.agent.execute_task(
                     f"Go to {url} and check the response status"
                 )
+                breaker.record_success()
                 
                 logger.info("Request successful", url=url, result=result)
                 
             except Exception as e:
+                breaker.record_failure()
+                
                 # Handle error with circuit breaker
                 error_result = await self.error_handler.handle_error(
                     error=e,
@@ -132,12 +213,15 @@ class AdvancedAutomationPatterns:
                 
                 # Add to DLQ if recovery fails
                 if not error_result.get("recovery_result", {}).get("success"):
-                    await self.dlq.add_message(
-                        operation="failed_request",
-                        payload={"url": url},
-                        error=e,
-                        max_retries=3
-                    )
+                    pending.append({
+                        "operation": "failed_request",
+                        "payload": {"url": url},
+                        "error": e,
+                        "max_retries": 3
+                    })
+        
+        if pending:
+            await self.dlq.add_batch(pending)
     
     @trace_operation("data_pipeline")
     async def data_pipeline_example(self):
@@ -160,29 +244,32 @@ class AdvancedAutomationPatterns:
             }
         ]
         
-        extracted_data = []
+        prompts = [
+            f"""
+            Go to {source['url']} and extract data using the {source['extractor']} method.
+            Return structured data that can be processed further.
+            """
+            for source in sources
+        ]
         
-        for source in sources:
-            try:
-                result = await self.agent.execute_task(
-                    f"""
-                    Go to {source['url']} and extract data using the {source['extractor']} method.
-                    Return structured data that can be processed further.
-                    """
-                )
-                
-                extracted_data.append({
-                    "source": source["url"],
-                    "type": source["extractor"],
-                    "data": result
-                })
-                
-            except Exception as e:
+        # One call runs every source concurrently on the agent's browsers
+        results = await self.agent.execute_tasks(prompts)
+        
+        extracted_data = []
+        for source, result in zip(sources, results):
+            if not result.get("success"):
                 logger.error(
                     "Data extraction failed",
                     source=source["url"],
-                    error=str(e)
+                    error=result.get("error")
                 )
+                continue
+            
+            extracted_data.append({
+                "source": source["url"],
+                "type": source["extractor"],
+                "data": result
+            })
         
         # Step 2: Process and transform data
         processed_data = await self._process_extracted_data(extracted_data)
@@ -195,34 +282,43 @@ class AdvancedAutomationPatterns:
     
     async def _process_extracted_data(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process and transform extracted data."""
-        processed = []
+        processed_at = _PROCESSED_AT
+        sizes: Dict[int, int] = {}  # Items in one run stay alive, so id() is stable
         
-        for item in data:
-            # Simulate data processing
-            processed_item = {
+        # Simulate data processing
+        return [
+            {
                 "source": item["source"],
                 "type": item["type"],
-                "processed_at": "2024-01-01T00:00:00Z",
-                "data_size": len(str(item["data"])),
+                "processed_at": processed_at,
+                "data_size": _measure(item["data"], sizes),
                 "processed_data": item["data"]
             }
-            processed.append(processed_item)
-        
-        return processed
+            for item in data
+        ]
     
     async def _generate_data_report(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate a summary report of processed data."""
+        # Single pass over the processed items
+        total_size = 0
+        source_types = set()
+        processing_summary = {}
+        
+        for item in data:
+            size = item["data_size"]
+            item_type = item["type"]
+            total_size += size
+            source_types.add(item_type)
+            processing_summary[item["source"]] = {
+                "type": item_type,
+                "size": size
+            }
+        
         return {
             "total_sources": len(data),
-            "total_data_size": sum(item["data_size"] for item in data),
-            "source_types": list(set(item["type"] for item in data)),
-            "processing_summary": {
-                item["source"]: {
-                    "type": item["type"],
-                    "size": item["data_size"]
-                }
-                for item in data
-            }
+            "total_data_size": total_size,
+            "source_types": list(source_types),
+            "processing_summary": processing_summary
         }
     
     @trace_operation("retry_with_backoff")
@@ -230,66 +326,60 @@ class AdvancedAutomationPatterns:
         """Example: Retry pattern with exponential backoff."""
         logger.info("Starting retry with backoff example")
         
-        from browserbot.core.retry import RetryableOperation
-        
-        max_attempts = 3
-        operation_name = "flaky_operation"
-        
+        # Exponential backoff (1s, 2s, 4s, ...) with jitter so many agents
+        # retrying at once do not hit the service in lockstep
         async with RetryableOperation(
-            max_attempts=max_attempts,
+            max_attempts=3,
             base_delay=1.0,
+            backoff="exponential",
             exceptions=(Exception,)
         ) as retry_op:
             
-            for attempt in range(max_attempts):
-                try:
+            async for attempt in retry_op:
+                with retry_op:
                     # Simulate a flaky operation
-                    if attempt < 2:
+                    if attempt < 3:
                         # Force failure for first two attempts
                         await self.agent.execute_task(
                             "Go to https://httpbin.org/status/500"
                         )
-                    else:
-                        # Success on third attempt
-                        result = await self.agent.execute_task(
-                            "Go to https://httpbin.org/status/200 and confirm success"
-                        )
-                        
-                        logger.info(
-                            "Operation succeeded",
-                            attempt=attempt + 1,
-                            result=result
-                        )
-                        return result
-                        
-                except Exception as e:
-                    logger.warning(
-                        "Operation failed, will retry",
-                        attempt=attempt + 1,
-                        error=str(e)
+                        raise RuntimeError(f"Simulated failure on attempt {attempt}")
+                    
+                    # Success on third attempt
+                    result = await self.agent.execute_task(
+                        "Go to https://httpbin.org/status/200 and confirm success"
                     )
                     
-                    if retry_op.should_retry():
-                        await retry_op.wait_before_retry()
-                    else:
-                        raise e
+                    logger.info(
+                        "Operation succeeded",
+                        attempt=attempt,
+                        result=result
+                    )
+                    return result
+                
+                logger.warning(
+                    "Operation failed, will retry",
+                    attempt=attempt,
+                    error=str(retry_op.last_exception)
+                )
+        
+        raise retry_op.last_exception
     
     @trace_operation("cache_pattern")
     async def caching_pattern_example(self):
         """Example: Caching pattern for expensive operations."""
         logger.info("Starting caching pattern example")
         
-        # Simple in-memory cache
-        cache = {}
+        # Bounded LRU cache with expiry; expired entries remain available as stale data
+        cache = TTLCache(maxsize=128, ttl=300)
         
         async def cached_operation(url: str) -> Dict[str, Any]:
             """Perform operation with caching."""
-            cache_key = f"page_content_{url}"
-            
             # Check cache first
-            if cache_key in cache:
+            hit = cache.get(url)
+            if hit is not None:
                 logger.info("Cache hit", url=url)
-                return cache[cache_key]
+                return hit
             
             # Cache miss - perform operation
             logger.info("Cache miss, fetching data", url=url)
@@ -300,22 +390,24 @@ class AdvancedAutomationPatterns:
                 )
                 
                 # Store in cache
-                cache[cache_key] = {
+                entry = {
                     "data": result,
                     "cached_at": "2024-01-01T00:00:00Z"
                 }
+                cache.put(url, entry)
                 
-                return cache[cache_key]
+                return entry
                 
             except Exception as e:
                 # On error, try to return stale cache data
-                if cache_key in cache:
+                stale = cache.get_stale(url)
+                if stale is not None:
                     logger.warning(
                         "Using stale cache data due to error",
                         url=url,
                         error=str(e)
                     )
-                    return cache[cache_key]
+                    return stale
                 raise
         
         # Test caching with repeated requests
@@ -339,8 +431,6 @@ class AdvancedAutomationPatterns:
         """Example: Health monitoring and self-healing."""
         logger.info("Starting health monitoring example")
         
-        from browserbot.monitoring.observability import health_checker
-        
         # Register custom health checks
         def browser_health_check() -> Dict[str, Any]:
             """Check if browser is responsive."""
@@ -400,10 +490,16 @@ class AdvancedAutomationPatterns:
         # 3. Reset network connections
         # 4. Notify monitoring systems
         
+        # Only restart when the browser really is unresponsive; other failures
+        # (e.g. network) would not be fixed by a restart
+        if await self._check_browser_responsive():
+            logger.info("Browser is responsive, skipping restart")
+            return
+        
         try:
             # Restart browser agent
             await self.agent.close()
-            self.agent = BrowserAgent()
+            self.agent = await self._create_agent()
             
             logger.info("Self-healing completed successfully")
             
@@ -411,29 +507,44 @@ class AdvancedAutomationPatterns:
             logger.error("Self-healing failed", error=str(e))
 
 
+    async def _check_browser_responsive(self, timeout: float = 5.0) -> bool:
+        """Check that the agent can still open a page and run script in it."""
+        try:
+            async with self.agent.browser_manager.get_page() as page:
+                await asyncio.wait_for(page.evaluate("1 + 1"), timeout)
+            return True
+        except Exception as e:
+            logger.warning("Browser responsiveness check failed", error=str(e))
+            return False
+
+
+_EXAMPLES = (
+    ("Parallel Browsing", AdvancedAutomationPatterns.parallel_browsing_example),
+    ("Circuit Breaker Pattern", AdvancedAutomationPatterns.circuit_breaker_pattern_example),
+    ("Data Pipeline", AdvancedAutomationPatterns.data_pipeline_example),
+    ("Retry with Backoff", AdvancedAutomationPatterns.retry_with_backoff_example),
+    ("Caching Pattern", AdvancedAutomationPatterns.caching_pattern_example),
+    ("Health Monitoring", AdvancedAutomationPatterns.health_monitoring_example),
+)
+
+
 async def main():
     """Run advanced automation patterns examples."""
     async with AdvancedAutomationPatterns() as patterns:
-        
-        examples = [
-            ("Parallel Browsing", patterns.parallel_browsing_example),
-            ("Circuit Breaker Pattern", patterns.circuit_breaker_pattern_example),
-            ("Data Pipeline", patterns.data_pipeline_example),
-            ("Retry with Backoff", patterns.retry_with_backoff_example),
-            ("Caching Pattern", patterns.caching_pattern_example),
-            ("Health Monitoring", patterns.health_monitoring_example),
-        ]
-        
-        for name, example_func in examples:
+        for name, example_func in _EXAMPLES:
             logger.info(f"Running advanced example: {name}")
             try:
-                result = await example_func()
+                result = await example_func(patterns)
                 logger.info(f"✅ {name} completed successfully", result=result)
             except Exception as e:
                 logger.error(f"❌ {name} failed", error=str(e))
             
             # Wait between examples
-            await asyncio.sleep(3)
+            if _DELAY:
+                await asyncio.sleep(_DELAY)
+    
+    await POOL.close()
+    await SharedChromium.close()
 
 
 if __name__ == "__main__":
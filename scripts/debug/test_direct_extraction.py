@@ -4,11 +4,7 @@ Direct test of the extraction improvements without Docker.
 """
 
 import asyncio
-import sys
-import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from browserbot.browser.browser_manager import BrowserManager
 from browserbot.browser.page_controller import PageController
@@ -31,24 +27,24 @@ async def test_direct_extraction():
             # Wait for page to load
             await asyncio.sleep(2)
             
-            # Test 1: Get all story titles using the new method
+            # Test 1 & 2: Get all story titles and links in a single evaluate
             logger.info("Test 1: Extracting all story titles with .titleline selector")
-            titles = await page_controller.get_all_text('.titleline')
+            stories = await page_controller.get_all_text_and_attrs('.titleline', 'href', attr_selector='a')
+            titles = stories["text"]
             logger.info(f"Found {len(titles)} story titles:")
             for i, title in enumerate(titles[:5], 1):
                 logger.info(f"  {i}. {title}")
             
-            # Test 2: Get all story links
             logger.info("\nTest 2: Extracting all story links")
-            links = await page_controller.get_all_attributes('.titleline a', 'href')
+            links = [link for link in stories["attrs"] if link]
             logger.info(f"Found {len(links)} story links:")
             for i, link in enumerate(links[:5], 1):
                 logger.info(f"  {i}. {link}")
             
             # Test 3: Use the extraction tool directly
             logger.info("\nTest 3: Testing extraction tool")
-            tools = create_browser_tools(page_controller)
-            extract_tool = next(t for t in tools if t.name == "extract")
+            tool_map = {tool.name: tool for tool in create_browser_tools(page_controller)}
+            extract_tool = tool_map["extract"]
             
             # Test text_all extraction
             result = await extract_tool.execute({
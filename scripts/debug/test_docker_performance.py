@@ -4,14 +4,36 @@ Performance test for BrowserBot in Docker environment.
 """
 
 import asyncio
+import statistics
 import time
-import sys
-import os
 
-# Add the app directory to Python path
-sys.path.insert(0, '/home/browserbot/app')
 
-from src.browserbot.agents.browser_agent import BrowserAgent
+from browserbot.agents.browser_agent import BrowserAgent
+from browserbot.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _timed(func, *args):
+    """Await func(*args) and return (duration, result) using a monotonic clock."""
+    start = time.perf_counter()
+    result = await func(*args)
+    return time.perf_counter() - start, result
+
+
+def _print_stats(agent):
+    """Print browser and cache stats for the agent."""
+    stats = agent.browser_manager.get_stats()
+    print(f"  🌐 Active browsers: {stats.get('active_browsers', 0)}")
+    print(f"  🔥 Warm browsers: {stats.get('warm_browsers', 0)}")
+    
+    # Get cache stats if available
+    if hasattr(agent.llm, 'get_cache_stats'):
+        cache_stats = agent.llm.get_cache_stats()
+        print(f"  💾 AI Cache: {cache_stats}")
+    
+    if stats.get('cache_stats'):
+        print(f"  📊 Browser Cache: Hit rate {stats['cache_stats'].get('hit_rate', 0):.1f}%")
 
 
 async def test_task_performance(task: str, runs: int = 3):
@@ -19,44 +41,36 @@ async def test_task_performance(task: str, runs: int = 3):
     print(f"\n🧪 Testing: {task}")
     print("=" * 60)
     
-    timings = []
-    
     async with BrowserAgent(enable_caching=True) as agent:
-        for i in range(runs):
-            print(f"\nRun {i+1}:")
-            start = time.time()
-            
-            result = await agent.execute_task(task)
-            
-            duration = time.time() - start
-            timings.append(duration)
-            
-            print(f"  ⏱️  Duration: {duration:.2f}s")
-            print(f"  ✅ Success: {result.get('success', False)}")
-            
-            # Get browser stats
-            stats = agent.browser_manager.get_stats()
-            print(f"  🌐 Active browsers: {stats.get('active_browsers', 0)}")
-            print(f"  🔥 Warm browsers: {stats.get('warm_browsers', 0)}")
-            
-            # Get cache stats if available
-            if hasattr(agent.llm, 'get_cache_stats'):
-                cache_stats = agent.llm.get_cache_stats()
-                print(f"  💾 AI Cache: {cache_stats}")
-            
-            if stats.get('cache_stats'):
-                print(f"  📊 Browser Cache: Hit rate {stats['cache_stats'].get('hit_rate', 0):.1f}%")
+        # Cold run on its own so it pays for cache and browser warm-up
+        cold, result = await _timed(agent.execute_task, task)
+        logger.info("run_complete", run=1, cache="cold", duration=cold, success=result.get("success", False))
+        _print_stats(agent)
+        
+        # Remaining runs concurrently to measure warm-cache throughput
+        warm_runs = await asyncio.gather(
+            *(_timed(agent.execute_task, task) for _ in range(runs - 1))
+        )
+        for i, (duration, result) in enumerate(warm_runs, 2):
+            logger.info("run_complete", run=i, cache="warm", duration=duration, success=result.get("success", False))
+        if warm_runs:
+            _print_stats(agent)
+    
+    warm = [duration for duration, _ in warm_runs]
+    timings = [cold] + warm
     
     # Calculate improvements
-    if len(timings) >= 2:
-        improvement = (timings[0] - timings[1]) / timings[0] * 100
-        speedup = timings[0] / timings[1]
+    if warm:
+        warm_median = statistics.median(warm)
+        improvement = (cold - warm_median) / cold * 100
+        speedup = cold / warm_median
         
         print(f"\n📊 Performance Summary for: {task[:50]}...")
-        print(f"  First run:  {timings[0]:.2f}s (cold cache)")
-        print(f"  Second run: {timings[1]:.2f}s (warm cache)")
-        if len(timings) >= 3:
-            print(f"  Third run:  {timings[2]:.2f}s")
+        print(f"  Cold run:    {cold:.2f}s")
+        print(f"  Warm median: {warm_median:.2f}s ({len(warm)} concurrent runs)")
+        if len(warm) >= 2:
+            warm_p95 = statistics.quantiles(warm, n=20, method="inclusive")[-1]
+            print(f"  Warm p95:    {warm_p95:.2f}s")
         print(f"\n  🚀 Speedup: {speedup:.1f}x faster")
         print(f"  📈 Improvement: {improvement:.0f}%")
     
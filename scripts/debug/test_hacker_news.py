@@ -54,14 +54,11 @@ async def test_hacker_news_extraction():
         
         # Test 3: Manual extraction using raw tools
         logger.info("\nTest 3: Direct tool execution test...")
-        from browserbot.browser.browser_manager import BrowserManager
         from browserbot.browser.page_controller import PageController
         from browserbot.agents.tools import create_browser_tools
         
-        browser_manager = BrowserManager()
-        await browser_manager.initialize()
-        
-        async with browser_manager.get_page(url="https://news.ycombinator.com") as page:
+        # Reuse the agent's browser manager rather than launching a second Chromium
+        async with agent.browser_manager.get_page(url="https://news.ycombinator.com") as page:
             page_controller = PageController(page)
             
             # Direct method call
@@ -72,8 +69,8 @@ async def test_hacker_news_extraction():
                 logger.info(f"  {i}. {title}")
             
             # Test extraction tool directly
-            tools = create_browser_tools(page_controller)
-            extract_tool = next(t for t in tools if t.name == "extract")
+            tool_map = {tool.name: tool for tool in create_browser_tools(page_controller)}
+            extract_tool = tool_map["extract"]
             
             tool_result = await extract_tool.execute({
                 "selector": ".titleline",
@@ -82,8 +79,6 @@ async def test_hacker_news_extraction():
             
             logger.info("Direct tool execution result:", tool_result)
         
-        await browser_manager.shutdown()
-        
     except Exception as e:
         logger.error("Test failed with error:", error=str(e), exc_info=True)
     
@@ -62,5 +62,15 @@ async def test_performance():
     print("\n✅ Test completed!")
 
 
+def install_event_loop():
+    """Use uvloop's faster event loop for the CDP chatter if it's installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(test_performance())
\ No newline at end of file
@@ -1,12 +1,18 @@
 """Factory for creating agents with feature flags and enhancements."""
 
+import asyncio
 from typing import Optional, Dict, Any
 from langchain_core.language_models import BaseChatModel
 from .browser_agent import BrowserAgent
 from .mistral_tool_executor import MistralToolExecutor
 from .enhanced_executor import EnhancedToolExecutor
+from .cached_llm_wrapper import CachedLLMWrapper
+from ..core.config import settings
+from ..core.disk_cache import DiskCache
 from ..core.feature_flags import is_feature_enabled
+from ..core.http_client import close_http_client, warm_http_client
 from ..core.logger import setup_logger
+from ..core.semantic_cache import SemanticCache
 from ..browser.browser_manager import BrowserManager
 from ..browser.advanced_stealth import AdvancedStealth
 
@@ -15,8 +21,40 @@ logger = setup_logger(__name__)
 class AgentFactory:
     """Factory for creating browser agents with appropriate enhancements."""
     
-    @staticmethod
+    # Browser pool shared by every agent the factory creates
+    _manager: Optional[BrowserManager] = None
+    _manager_lock: Optional[asyncio.Lock] = None
+    
+    @classmethod
+    async def _get_manager(cls) -> BrowserManager:
+        """Create and initialize the shared browser manager on first use."""
+        if cls._manager_lock is None:
+            cls._manager_lock = asyncio.Lock()
+        
+        async with cls._manager_lock:
+            if cls._manager is None:
+                # Launching browsers and connecting to the model API are
+                # independent, so the first agent pays for the slower one
+                # instead of both
+                manager = BrowserManager()
+                await asyncio.gather(
+                    manager.initialize(),
+                    warm_http_client(settings.model_url)
+                )
+                cls._manager = manager
+        return cls._manager
+    
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Shut down the shared browser manager and the shared HTTP client."""
+        if cls._manager is not None:
+            await cls._manager.shutdown()
+            cls._manager = None
+        await close_http_client()
+    
+    @classmethod
     async def create_browser_agent(
+        cls,
         task: str,
         model_name: Optional[str] = None,
         headless: bool = False,
@@ -24,12 +62,9 @@ class AgentFactory:
     ) -> BrowserAgent:
         """Create a browser agent with feature-flag-based enhancements."""
         
-        # Initialize browser manager
-        browser_manager = BrowserManager()
-        await browser_manager.initialize()
-        
-        # Create base agent
-        agent = BrowserAgent(model_name=model_name)
+        # Create base agent on the shared browser pool
+        browser_manager = await cls._get_manager()
+        agent = BrowserAgent(model_name=model_name, browser_manager=browser_manager)
         
         # Apply enhancements based on feature flags
         
@@ -58,6 +93,16 @@ class AgentFactory:
             logger.info("Enabling detailed performance monitoring")
             agent._enable_monitoring = True
         
+        # Semantic response cache on top of the exact-match AI cache
+        if is_feature_enabled("semantic_cache", user_id) and isinstance(agent.llm, CachedLLMWrapper):
+            logger.info("Enabling semantic AI response cache")
+            agent.llm.semantic_cache = SemanticCache(threshold=0.85)
+        
+        # Keep exact-match AI responses on disk so later runs reuse them
+        if is_feature_enabled("persistent_llm_cache", user_id) and isinstance(agent.llm, CachedLLMWrapper):
+            logger.info("Enabling persistent AI response cache")
+            agent.llm.disk_cache = DiskCache()
+        
         return agent
 
     @staticmethod
@@ -84,7 +129,11 @@ class AgentFactory:
         # Check if model needs custom executor (Mistral)
         elif "mistral" in model_name.lower():
             logger.info("Creating Mistral tool executor")
-            return MistralToolExecutor(tools, llm)
+            return MistralToolExecutor(
+                tools,
+                llm,
+                dispatch_while_streaming=is_feature_enabled("streaming_tool_dispatch", user_id)
+            )
         
         # Default to standard executor
         else:
@@ -104,7 +153,11 @@ class AgentFactory:
             "browser_pooling": is_feature_enabled("browser_pooling", user_id),
             "natural_language_fallback": is_feature_enabled("natural_language_fallback", user_id),
             "performance_monitoring": is_feature_enabled("performance_monitoring", user_id),
-            "adaptive_delays": is_feature_enabled("adaptive_delays", user_id)
+            "adaptive_delays": is_feature_enabled("adaptive_delays", user_id),
+            "semantic_cache": is_feature_enabled("semantic_cache", user_id),
+            "persistent_llm_cache": is_feature_enabled("persistent_llm_cache", user_id),
+            "streaming_tool_dispatch": is_feature_enabled("streaming_tool_dispatch", user_id),
+            "speculative_reads": is_feature_enabled("speculative_reads", user_id)
         }
 
     @staticmethod
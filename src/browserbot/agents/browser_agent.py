@@ -3,13 +3,14 @@ Main browser agent that combines AI reasoning with browser automation capabiliti
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, AsyncIterator
+from collections import OrderedDict, deque
+from typing import Dict, Any, Awaitable, Deque, List, Optional, AsyncIterator
 from datetime import datetime
 import json
 
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, trim_messages
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from pydantic import BaseModel, Field
@@ -20,40 +21,47 @@ from ..browser.stealth import StealthConfig
 from ..core.config import settings
 from ..core.logger import get_logger
 from ..core.errors import BrowserError, AIModelError, ConfigurationError
+from ..core.http_client import get_http_client
 from ..core.retry import with_retry
+from ..core.concurrency import gather_bounded
 
 from .tools import create_browser_tools
 from .prompts import BrowserAgentPrompts
 from .cached_llm_wrapper import CachedLLMWrapper
+from .gated_llm import GatedChatOpenAI
 from .enhanced_executor import EnhancedToolExecutor
 from ..browser.advanced_stealth import AdvancedStealth
 from ..core.feature_flags import is_feature_enabled
 
 logger = get_logger(__name__)
 
+# Chat histories kept per agent; the least recently used session is dropped first
+MAX_CHAT_SESSIONS = 1024
+
 
 class InMemoryHistory(BaseChatMessageHistory, BaseModel):
     """In-memory implementation of chat message history with automatic trimming."""
     
-    messages: List[BaseMessage] = Field(default_factory=list)
+    # Bounded to max_message_pairs * 2, so appends drop the oldest messages in O(1)
+    messages: Deque[BaseMessage] = Field(default_factory=deque)
     max_message_pairs: int = Field(default=10)
     
+    def model_post_init(self, __context: Any) -> None:
+        self.messages = deque(self.messages, maxlen=self.max_message_pairs * 2)
+    
     def add_messages(self, messages: List[BaseMessage]) -> None:
         """Add messages and automatically trim to window size."""
+        trimmed = len(self.messages) + len(messages) > self.messages.maxlen
         self.messages.extend(messages)
         
-        # Keep only the last max_message_pairs * 2 messages
-        max_messages = self.max_message_pairs * 2
-        if len(self.messages) > max_messages:
-            # Ensure we start with a human message
-            trim_point = len(self.messages) - max_messages
-            while trim_point < len(self.messages) and isinstance(self.messages[trim_point], AIMessage):
-                trim_point += 1
-            self.messages = self.messages[trim_point:]
+        # Ensure we start with a human message
+        if trimmed:
+            while self.messages and isinstance(self.messages[0], AIMessage):
+                self.messages.popleft()
     
     def clear(self) -> None:
         """Clear all messages."""
-        self.messages = []
+        self.messages.clear()
 
 
 class BrowserAgent:
@@ -70,38 +78,46 @@ class BrowserAgent:
         max_browsers: int = None,
         stealth_config: Optional[StealthConfig] = None,
         memory_size: int = 10,
-        enable_caching: bool = True
+        enable_caching: bool = True,
+        cdp_endpoint: Optional[str] = None,
+        browser_manager: Optional[BrowserManager] = None
     ):
         self.model_name = model_name or settings.model_name
         self.enable_caching = enable_caching
-        self.browser_manager = BrowserManager(
+        # A manager passed in is shared with other agents, so shutdown() leaves it running
+        self._owns_browser_manager = browser_manager is None
+        self.browser_manager = browser_manager or BrowserManager(
             max_browsers=max_browsers,
             stealth_config=stealth_config,
-            enable_caching=enable_caching
+            enable_caching=enable_caching,
+            cdp_endpoint=cdp_endpoint
         )
         
         # Memory configuration
         self.memory_size = memory_size
-        self.chat_histories: Dict[str, InMemoryHistory] = {}
+        self.chat_histories: "OrderedDict[str, InMemoryHistory]" = OrderedDict()
+        
+        # Pick the executor builder for this model once; model_name never changes
+        model_lower = self.model_name.lower()
+        self._agent_builder = next(
+            (builder for name, builder in _AGENT_BUILDERS if name in model_lower),
+            BrowserAgent._build_fallback_executor
+        )
+        self._prompt_cache_control = any(name in model_lower for name in _PROMPT_CACHE_CONTROL_MODELS)
+        # Verbose executors print every step synchronously; only worth it when debugging
+        self._verbose_executor = settings.log_level.upper() == "DEBUG"
         
         # Initialize LLM with caching if enabled
         self.llm = self._create_llm()
+        self._cached_llm: Optional[CachedLLMWrapper] = None
         
         # Agent components (initialized when first used)
         self.agent_executor: Optional[AgentExecutor] = None
+        # Tool-calling runnable shared by every task's executor
+        self._tool_calling_agent: Optional[Any] = None
         self.current_page_controller: Optional[PageController] = None
         self.session_id: str = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Create message trimmer for consistent window behavior
-        self.message_trimmer = trim_messages(
-            max_tokens=self.memory_size * 2,  # Convert pairs to message count
-            strategy="last",
-            token_counter=len,  # Count messages instead of tokens
-            include_system=True,
-            allow_partial=False,
-            start_on="human"
-        )
-        
         logger.info(
             "Browser agent initialized",
             model_name=self.model_name,
@@ -117,6 +133,32 @@ class BrowserAgent:
         """Async context manager exit."""
         await self.shutdown()
     
+    def set_caching(self, enabled: bool) -> None:
+        """
+        Turn AI response and page caching on or off for subsequent tasks.
+        
+        The browser pool and the LLM's connection pool are left alone, so
+        switching doesn't pay any cold-start cost.
+        
+        Args:
+            enabled: Whether to use caches
+        """
+        if enabled == self.enable_caching:
+            return
+        
+        self.enable_caching = enabled
+        if enabled:
+            # Reuse the previous wrapper so its cache and stats survive
+            self.llm = self._cached_llm or CachedLLMWrapper(self.llm, cache_ttl=7200)
+        elif isinstance(self.llm, CachedLLMWrapper):
+            self._cached_llm = self.llm
+            self.llm = self.llm.base_llm
+        
+        # Executors hold on to the old LLM
+        self.agent_executor = None
+        self._tool_calling_agent = None
+        logger.info("Caching toggled", enabled=enabled)
+    
     def _create_llm(self) -> ChatOpenAI:
         """Create and configure the language model."""
         try:
@@ -130,14 +172,15 @@ class BrowserAgent:
                     "X-Title": "BrowserBot"
                 }
             
-            base_llm = ChatOpenAI(
+            base_llm = GatedChatOpenAI(
                 model=model_config["model"],
                 temperature=model_config["temperature"],
                 max_tokens=model_config["max_tokens"],
                 openai_api_key=model_config["api_key"],
                 openai_api_base=model_config["base_url"],
                 streaming=True,
-                default_headers=default_headers
+                default_headers=default_headers,
+                http_async_client=get_http_client()
             )
             
             # Wrap with caching if enabled
@@ -153,9 +196,15 @@ class BrowserAgent:
     
     def _get_session_history(self, session_id: str) -> BaseChatMessageHistory:
         """Get or create chat history for a session."""
-        if session_id not in self.chat_histories:
-            self.chat_histories[session_id] = InMemoryHistory(max_message_pairs=self.memory_size)
-        return self.chat_histories[session_id]
+        history = self.chat_histories.get(session_id)
+        if history is None:
+            history = InMemoryHistory(max_message_pairs=self.memory_size)
+            self.chat_histories[session_id] = history
+            if len(self.chat_histories) > MAX_CHAT_SESSIONS:
+                self.chat_histories.popitem(last=False)
+        else:
+            self.chat_histories.move_to_end(session_id)
+        return history
     
     async def execute_task(
         self,
@@ -184,21 +233,26 @@ class BrowserAgent:
             # Get a browser context for this task
             async with self.browser_manager.get_browser() as browser_context:
                 page = await browser_context.new_page()
-                self.current_page_controller = PageController(
+                # Kept local: execute_tasks runs several of these on one agent
+                page_controller = PageController(
                     page, 
                     enable_caching=self.enable_caching,
                     reduce_delays=True
                 )
                 
                 # Create agent executor with current browser context
-                agent_executor = await self._create_agent_executor()
+                agent_executor = await self._create_agent_executor(page_controller)
                 
-                # Execute the task
-                result = await self._execute_with_agent(
-                    agent_executor,
-                    task,
-                    context,
-                    max_iterations
+                # Execute the task, abandoning the model call if the page goes away
+                result = await self._run_while_page_open(
+                    page,
+                    self._execute_with_agent(
+                        agent_executor,
+                        task,
+                        context,
+                        max_iterations,
+                        page_controller
+                    )
                 )
                 
                 # Add execution metadata
@@ -221,6 +275,69 @@ class BrowserAgent:
                 "session_id": self.session_id
             }
     
+    async def _run_while_page_open(self, page: Any, coro: Awaitable[Any]) -> Any:
+        """
+        Await coro, cancelling it if the page closes first.
+        
+        Without this a crashed or closed browser context leaves the agent
+        waiting on (and paying for) model calls whose tools can no longer run.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                watchdog = tg.create_task(self._watch_page_closed(page))
+                work = tg.create_task(coro)
+                work.add_done_callback(lambda _: watchdog.cancel())
+        except* Exception as group:
+            # Surface the original error rather than the group wrapping it
+            raise group.exceptions[0]
+        
+        return work.result()
+    
+    async def _watch_page_closed(self, page: Any) -> None:
+        """Raise BrowserError once the page closes."""
+        await page.wait_for_event("close", timeout=0)
+        raise BrowserError("Page closed during task execution")
+    
+    async def execute_tasks(
+        self,
+        tasks: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        max_iterations: int = 15,
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute independent tasks concurrently, each in its own browser context.
+        
+        Args:
+            tasks: Natural language task descriptions
+            context: Additional context shared by every task
+            max_iterations: Maximum number of agent iterations per task
+            max_concurrency: Tasks in flight at once (defaults to max_browsers)
+            
+        Returns:
+            One result dictionary per task, in input order
+        """
+        if not self.browser_manager._initialized:
+            await self.browser_manager.initialize()
+        
+        limit = max_concurrency or self.browser_manager.max_browsers
+        results = await gather_bounded(
+            *(self.execute_task(task, context, max_iterations) for task in tasks),
+            limit=limit
+        )
+        
+        # execute_task reports failures as dicts; normalise anything that escaped
+        return [
+            result if not isinstance(result, BaseException) else {
+                "success": False,
+                "error": str(result),
+                "error_type": type(result).__name__,
+                "task": task,
+                "session_id": self.session_id
+            }
+            for task, result in zip(tasks, results)
+        ]
+    
     async def chat(
         self,
         message: str,
@@ -336,75 +453,95 @@ class BrowserAgent:
                 "session_id": self.session_id
             }
     
-    async def _create_agent_executor(self) -> AgentExecutor:
+    async def _create_agent_executor(
+        self,
+        page_controller: Optional[PageController] = None
+    ) -> AgentExecutor:
         """Create an agent executor with intelligent model-specific handling."""
-        if not self.current_page_controller:
+        page_controller = page_controller or self.current_page_controller
+        if not page_controller:
             raise ConfigurationError("No active page controller")
         
         # Create browser automation tools
-        tools = create_browser_tools(self.current_page_controller)
+        tools = create_browser_tools(
+            page_controller,
+            speculative_reads=is_feature_enabled("speculative_reads")
+        )
         
-        # Get the base prompt and create agent
-        prompt = BrowserAgentPrompts.get_system_prompt()
+        # Get the base prompt and create agent. OpenAI-style providers cache
+        # long prompt prefixes automatically; Anthropic and Gemini need the
+        # static system block marked explicitly.
+        prompt = BrowserAgentPrompts.get_system_prompt(cache_control=self._prompt_cache_control)
         
-        # Intelligent model detection and handling
-        model_lower = self.model_name.lower()
+        return self._agent_builder(self, tools, prompt)
+    
+    def _get_tool_calling_agent(self, tools: List[Any], prompt: Any) -> Any:
+        """
+        Get the tool-calling runnable, building it on first use.
         
-        # Models with strong native tool calling support
-        if any(model in model_lower for model in ["deepseek", "qwen", "gpt-", "claude", "gemini"]):
-            logger.info("Using native tool calling agent", model=self.model_name)
-            
-            # Use create_tool_calling_agent for models with excellent tool calling
-            agent = create_tool_calling_agent(self.llm, tools, prompt)
+        The runnable only depends on the prompt and the tool schemas bound to
+        the LLM, which are the same for every task; tool calls are dispatched
+        by name to whichever tools the executor holds. Every task gets its own
+        page controller, so the executor itself is still built per task.
+        """
+        if self._tool_calling_agent is None:
+            self._tool_calling_agent = create_tool_calling_agent(self.llm, tools, prompt)
+        return self._tool_calling_agent
+    
+    def _build_native_executor(self, tools: List[Any], prompt: Any) -> AgentExecutor:
+        """Executor for models with strong native tool calling support."""
+        logger.info("Using native tool calling agent", model=self.model_name)
+        
+        # Use create_tool_calling_agent for models with excellent tool calling
+        agent = self._get_tool_calling_agent(tools, prompt)
+        
+        return AgentExecutor(
+            agent=agent,
+            tools=tools,
+            verbose=self._verbose_executor,
+            return_intermediate_steps=True,
+            max_iterations=15,
+            handle_parsing_errors=True
+        )
+    
+    def _build_mistral_executor(self, tools: List[Any], prompt: Any) -> Any:
+        """Executor that parses tool calls out of Mistral's text responses."""
+        # Check if enhanced executor is enabled
+        if is_feature_enabled("enhanced_executor"):
+            logger.info("Using enhanced tool executor", model=self.model_name)
+            return EnhancedToolExecutor(tools, self.llm)
+        
+        logger.info("Using custom Mistral tool executor", model=self.model_name)
+        from .mistral_tool_executor import MistralToolExecutor
+        return MistralToolExecutor(
+            tools,
+            self.llm,
+            dispatch_while_streaming=is_feature_enabled("streaming_tool_dispatch")
+        )
+    
+    def _build_fallback_executor(self, tools: List[Any], prompt: Any) -> Any:
+        """Executor for unknown models: native tool calling, else the Mistral parser."""
+        logger.info("Using fallback tool calling agent", model=self.model_name)
+        
+        # Default fallback for unknown models
+        try:
+            agent = self._get_tool_calling_agent(tools, prompt)
             
-            agent_executor = AgentExecutor(
+            return AgentExecutor(
                 agent=agent,
                 tools=tools,
-                verbose=True,
+                verbose=self._verbose_executor,
                 return_intermediate_steps=True,
                 max_iterations=15,
                 handle_parsing_errors=True
             )
             
-            return agent_executor
-            
-        elif "mistral" in model_lower:
-            # Check if enhanced executor is enabled
-            if is_feature_enabled("enhanced_executor"):
-                logger.info("Using enhanced tool executor", model=self.model_name)
-                tool_executor = EnhancedToolExecutor(tools, self.llm)
-                return tool_executor
-            else:
-                logger.info("Using custom Mistral tool executor", model=self.model_name)
-                from .mistral_tool_executor import MistralToolExecutor
-                tool_executor = MistralToolExecutor(tools, self.llm)
-                return tool_executor
-            
-        else:
-            logger.info("Using fallback tool calling agent", model=self.model_name)
+        except Exception as e:
+            logger.warning("Standard tool calling failed, using Mistral fallback", error=str(e))
             
-            # Default fallback for unknown models
-            try:
-                agent = create_tool_calling_agent(self.llm, tools, prompt)
-                
-                agent_executor = AgentExecutor(
-                    agent=agent,
-                    tools=tools,
-                    verbose=True,
-                    return_intermediate_steps=True,
-                    max_iterations=15,
-                    handle_parsing_errors=True
-                )
-                
-                return agent_executor
-                
-            except Exception as e:
-                logger.warning("Standard tool calling failed, using Mistral fallback", error=str(e))
-                
-                # Ultimate fallback to custom parser
-                from .mistral_tool_executor import MistralToolExecutor
-                tool_executor = MistralToolExecutor(tools, self.llm)
-                return tool_executor
+            # Ultimate fallback to custom parser
+            from .mistral_tool_executor import MistralToolExecutor
+            return MistralToolExecutor(tools, self.llm)
     
     @with_retry(max_attempts=2, exceptions=(AIModelError,))
     async def _execute_with_agent(
@@ -412,9 +549,11 @@ class BrowserAgent:
         agent_executor: AgentExecutor,
         task: str,
         context: Optional[Dict[str, Any]],
-        max_iterations: int
+        max_iterations: int,
+        page_controller: Optional[PageController] = None
     ) -> Dict[str, Any]:
         """Execute task with the agent executor."""
+        page_controller = page_controller or self.current_page_controller
         try:
             # Prepare input
             input_data = {
@@ -437,7 +576,7 @@ class BrowserAgent:
                 "output": result["output"],
                 "intermediate_steps": result.get("intermediate_steps", []),
                 "iterations": len(result.get("intermediate_steps", [])),
-                "action_history": self.current_page_controller.get_action_history() if self.current_page_controller else []
+                "action_history": page_controller.get_action_history() if page_controller else []
             }
             
         except Exception as e:
@@ -458,33 +597,56 @@ class BrowserAgent:
     ) -> AsyncIterator[Dict[str, Any]]:
         """Stream agent execution with intermediate results."""
         try:
-            # This is a simplified streaming implementation
-            # In a full implementation, you'd want to integrate with LangChain's streaming callbacks
-            
             input_data = {
                 "input": task
             }
             if context:
                 input_data["context"] = json.dumps(context, indent=2)
             
-            # Execute and yield intermediate steps
-            result = await agent_executor.ainvoke(input_data)
-            
-            # Yield intermediate steps
-            for i, (action, observation) in enumerate(result.get("intermediate_steps", [])):
-                yield {
-                    "type": "step",
-                    "step": i + 1,
-                    "action": str(action),
-                    "observation": str(observation)
-                }
-            
-            # Yield final result
-            yield {
-                "type": "result",
-                "output": result["output"],
-                "total_steps": len(result.get("intermediate_steps", []))
-            }
+            # Custom executors (Mistral, enhanced) only run to completion
+            if not hasattr(agent_executor, "astream_events"):
+                async for update in self._stream_completed_execution(agent_executor, input_data):
+                    yield update
+                return
+            
+            step = 0
+            async for event in agent_executor.astream_events(
+                input_data,
+                config={"run_name": "browser_task"},
+                version="v2"
+            ):
+                kind = event["event"]
+                
+                if kind == "on_chat_model_stream":
+                    delta = event["data"]["chunk"].content
+                    if delta and isinstance(delta, str):
+                        yield {"type": "token", "delta": delta}
+                
+                elif kind == "on_tool_start":
+                    yield {
+                        "type": "action",
+                        "step": step + 1,
+                        "tool": event["name"],
+                        "input": event["data"].get("input")
+                    }
+                
+                elif kind == "on_tool_end":
+                    step += 1
+                    yield {
+                        "type": "step",
+                        "step": step,
+                        "action": event["name"],
+                        "observation": str(event["data"].get("output"))
+                    }
+                
+                elif kind == "on_chain_end" and not event["parent_ids"]:
+                    # End of the executor run itself, not one of its sub-chains
+                    output = event["data"].get("output") or {}
+                    yield {
+                        "type": "result",
+                        "output": output.get("output"),
+                        "total_steps": step
+                    }
             
         except Exception as e:
             yield {
@@ -493,6 +655,28 @@ class BrowserAgent:
                 "error_type": type(e).__name__
             }
     
+    async def _stream_completed_execution(
+        self,
+        agent_executor: Any,
+        input_data: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run an executor that can't stream, then replay its steps."""
+        result = await agent_executor.ainvoke(input_data)
+        
+        for i, (action, observation) in enumerate(result.get("intermediate_steps", [])):
+            yield {
+                "type": "step",
+                "step": i + 1,
+                "action": str(action),
+                "observation": str(observation)
+            }
+        
+        yield {
+            "type": "result",
+            "output": result["output"],
+            "total_steps": len(result.get("intermediate_steps", []))
+        }
+    
     async def get_current_page_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the current page."""
         if self.current_page_controller:
@@ -508,7 +692,7 @@ class BrowserAgent:
     def get_conversation_history(self) -> List[BaseMessage]:
         """Get the conversation history for the current session."""
         history = self._get_session_history(self.session_id)
-        return history.messages
+        return list(history.messages)
     
     def clear_conversation_history(self) -> None:
         """Clear the conversation history for the current session."""
@@ -534,7 +718,30 @@ class BrowserAgent:
         logger.info("Shutting down browser agent", session_id=self.session_id)
         
         try:
-            await self.browser_manager.shutdown()
+            # Let responses that were already returned finish reaching the cache
+            cached_llm = self.llm if isinstance(self.llm, CachedLLMWrapper) else self._cached_llm
+            if cached_llm:
+                await cached_llm.flush()
+            if self._owns_browser_manager:
+                await self.browser_manager.shutdown()
             logger.info("Browser agent shutdown complete")
         except Exception as e:
-            logger.error("Error during agent shutdown", error=str(e))
\ No newline at end of file
+            logger.error("Error during agent shutdown", error=str(e))
+
+    async def close(self) -> None:
+        """Alias for shutdown()."""
+        await self.shutdown()
+
+
+# Model name substring -> executor builder, checked in order
+_AGENT_BUILDERS = (
+    ("deepseek", BrowserAgent._build_native_executor),
+    ("qwen", BrowserAgent._build_native_executor),
+    ("gpt-", BrowserAgent._build_native_executor),
+    ("claude", BrowserAgent._build_native_executor),
+    ("gemini", BrowserAgent._build_native_executor),
+    ("mistral", BrowserAgent._build_mistral_executor),
+)
+
+# Providers that only cache a prompt prefix when it is marked explicitly
+_PROMPT_CACHE_CONTROL_MODELS = ("claude", "anthropic", "gemini")
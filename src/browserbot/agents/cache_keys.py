@@ -0,0 +1,186 @@
+"""
+Cache keys for AI responses.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from langchain_core.messages import BaseMessage
+
+
+def _hasher() -> Any:
+    """
+    New SHA-256 hash for cache keys.
+
+    hashlib's SHA-256 comes from OpenSSL, which uses the CPU's SHA
+    instructions where present (most current x86-64 and ARMv8 parts) and
+    then outruns BLAKE2 on anything but tiny inputs. One fixed algorithm
+    keeps keys identical on every machine sharing a cache.
+    """
+    return hashlib.sha256(usedforsecurity=False)
+
+
+def _digest(h: Any) -> bytes:
+    """Truncate to 128 bits, plenty for entries that expire within hours."""
+    return h.digest()[:16]
+
+
+def _canonical(value: Any) -> bytes:
+    """Encode a value deterministically; strings are used as-is."""
+    if isinstance(value, str):
+        return b"s" + value.encode()
+    return b"j" + orjson.dumps(value, default=repr, option=orjson.OPT_SORT_KEYS)
+
+
+# Tool schemas are bound once per agent and passed unchanged on every call,
+# so their digest is remembered by object id. The schema itself is kept in
+# the entry so its id can't be reused by another object while cached.
+_TOOLS_DIGESTS_MAX = 32
+_tools_digests: Dict[int, Tuple[Any, bytes]] = {}
+
+
+def tools_fingerprint(tools: Any) -> bytes:
+    """
+    Digest of a tool schema list, serialized only the first time it's seen.
+
+    Args:
+        tools: Tool schemas as passed to the model
+
+    Returns:
+        16-byte digest
+    """
+    entry = _tools_digests.get(id(tools))
+    if entry is not None and entry[0] is tools:
+        return entry[1]
+
+    h = _hasher()
+    h.update(_canonical(tools))
+    digest = _digest(h)
+    if len(_tools_digests) >= _TOOLS_DIGESTS_MAX:
+        _tools_digests.clear()
+    _tools_digests[id(tools)] = (tools, digest)
+    return digest
+
+
+def _update(h: Any, data: bytes) -> None:
+    """Feed a length-prefixed field so adjacent fields can't run together."""
+    h.update(len(data).to_bytes(8, "little"))
+    h.update(data)
+
+
+# An agent loop resends the same system prompt and earlier turns on every
+# call, so plain-text message digests are remembered by (type, content).
+# Python caches a string's hash, so a repeated lookup is cheaper than
+# re-encoding and re-hashing the content. Kept small since keys hold the text.
+_MESSAGE_DIGESTS_MAX = 256
+_message_digests: Dict[Tuple[str, str], bytes] = {}
+# Earlier AI turns carry tool calls, which can't be keyed by content, but
+# the agent resends the same message objects from its step log, so their
+# digests are remembered by id like tool schemas. Without this every step
+# would re-serialize all earlier tool calls.
+_object_digests: Dict[int, Tuple[BaseMessage, bytes]] = {}
+
+
+def _hash_message(msg: BaseMessage) -> bytes:
+    h = _hasher()
+    _update(h, msg.__class__.__name__.encode())
+    _update(h, _canonical(msg.content))
+    _update(h, _canonical(getattr(msg, "additional_kwargs", None) or {}))
+    return _digest(h)
+
+
+def message_digest(msg: BaseMessage) -> bytes:
+    """
+    Digest of one message's type, content and extra fields.
+
+    Args:
+        msg: Message to hash
+
+    Returns:
+        16-byte digest
+    """
+    if not isinstance(msg.content, str) or getattr(msg, "additional_kwargs", None):
+        entry = _object_digests.get(id(msg))
+        if entry is not None and entry[0] is msg:
+            return entry[1]
+        digest = _hash_message(msg)
+        if len(_object_digests) >= _MESSAGE_DIGESTS_MAX:
+            _object_digests.clear()
+        _object_digests[id(msg)] = (msg, digest)
+        return digest
+
+    key = (msg.__class__.__name__, msg.content)
+    digest = _message_digests.get(key)
+    if digest is None:
+        digest = _hash_message(msg)
+        if len(_message_digests) >= _MESSAGE_DIGESTS_MAX:
+            _message_digests.clear()
+        _message_digests[key] = digest
+    return digest
+
+
+def llm_cache_key(
+    messages: List[BaseMessage],
+    llm: Any,
+    tools: Optional[Any] = None,
+    tool_choice: Optional[Any] = None
+) -> str:
+    """
+    Hash a model request into a cache key.
+
+    Per-message digests and the remaining fields are fed straight into one
+    hash instead of building and serializing a dict of the whole
+    conversation first.
+
+    Args:
+        messages: Conversation sent to the model
+        llm: Model whose name and sampling settings affect the output
+        tools: Tool schemas bound to the request
+        tool_choice: Tool choice setting of the request
+
+    Returns:
+        Hex digest identifying the request
+    """
+    h = _hasher()
+
+    for msg in messages:
+        # Fixed-size digests need no length prefix
+        h.update(message_digest(msg))
+
+    _update(h, _canonical([
+        getattr(llm, "model_name", getattr(llm, "model", None)),
+        getattr(llm, "temperature", None),
+        getattr(llm, "max_tokens", None),
+        tool_choice
+    ]))
+    _update(h, tools_fingerprint(tools) if tools else b"")
+
+    return _digest(h).hex()
+
+
+def context_namespace(
+    context: List[BaseMessage],
+    llm: Any,
+    tools: Optional[Any] = None
+) -> str:
+    """
+    Hash the parts of a request that surround the user's prompt.
+
+    Built from memoized message and tool digests, so a repeated system
+    prompt and tool list cost a lookup rather than a re-serialization.
+
+    Args:
+        context: Messages other than the user's prompt
+        llm: Model the request is sent to
+        tools: Tool schemas bound to the request
+
+    Returns:
+        Hex digest shared by requests that differ only in their prompt
+    """
+    h = _hasher()
+    for msg in context:
+        h.update(message_digest(msg))
+    _update(h, _canonical(getattr(llm, "model_name", getattr(llm, "model", None))))
+    _update(h, tools_fingerprint(tools) if tools else b"")
+    return _digest(h).hex()
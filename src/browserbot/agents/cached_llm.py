@@ -2,19 +2,61 @@
 Cached LLM wrapper for performance optimization.
 """
 
-import hashlib
-import json
-from typing import List, Optional, Any, AsyncIterator
+import asyncio
+from collections import deque
+from typing import Deque, List, Optional, Any, AsyncIterator, Set
+import orjson
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.outputs import ChatResult, ChatGeneration, ChatGenerationChunk
 from langchain_core.callbacks import CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun
 
 from ..core.cache import cache_manager
 from ..core.logger import get_logger
+from .cache_keys import llm_cache_key
 
 logger = get_logger(__name__)
 
+# Most keys remembered as missing from the cache
+KNOWN_MISSES_MAX = 4096
+
+# Seconds a cache lookup runs alone before the model is asked as well. Long
+# enough for a local Redis hit, short enough to hide a slow lookup's latency
+# behind the model call on a miss.
+CACHE_LOOKUP_HEAD_START = 0.005
+
+# Message classes by their ``type`` field, for rebuilding cached responses
+_MESSAGE_CLASSES = {
+    "ai": AIMessage,
+    "AIMessageChunk": AIMessage,
+    "human": HumanMessage,
+    "system": SystemMessage
+}
+
+
+def _dump_message(message: BaseMessage) -> dict:
+    """Keep only the fields needed to rebuild a generated message."""
+    data = {
+        "type": message.type,
+        "content": message.content,
+        "additional_kwargs": message.additional_kwargs
+    }
+    if isinstance(message, AIMessage) and message.tool_calls:
+        data["tool_calls"] = message.tool_calls
+    return data
+
+
+def _load_message(data: dict) -> BaseMessage:
+    """Rebuild a message stored by _dump_message as its original class."""
+    message_class = _MESSAGE_CLASSES.get(data.get("type"), AIMessage)
+    fields = {
+        "content": data["content"],
+        "additional_kwargs": data.get("additional_kwargs") or {}
+    }
+    if data.get("tool_calls"):
+        fields["tool_calls"] = data["tool_calls"]
+    return message_class(**fields)
+
 
 class CachedChatOpenAI(BaseChatModel):
     """
@@ -33,31 +75,27 @@ class CachedChatOpenAI(BaseChatModel):
         self._base_llm = base_llm
         self._cache_ttl = cache_ttl
         self._cache_stats = {"hits": 0, "misses": 0}
+        # Keys whose write-back failed, so a lookup would only miss again
+        self._known_misses: Set[str] = set()
+        self._known_miss_order: Deque[str] = deque()
+    
+    def _remember_miss(self, cache_key: str) -> None:
+        """Remember that cache_key isn't stored, evicting the oldest entry if full."""
+        if cache_key in self._known_misses:
+            return
+        if len(self._known_miss_order) >= KNOWN_MISSES_MAX:
+            self._known_misses.discard(self._known_miss_order.popleft())
+        self._known_misses.add(cache_key)
+        self._known_miss_order.append(cache_key)
     
     def _generate_cache_key(self, messages: List[BaseMessage], **kwargs) -> str:
         """Generate a cache key from messages and parameters."""
-        # Create a stable representation of the messages
-        message_data = []
-        for msg in messages:
-            message_data.append({
-                "type": msg.__class__.__name__,
-                "content": msg.content,
-                "additional_kwargs": msg.additional_kwargs
-            })
-        
-        # Include relevant kwargs that affect the output
-        cache_data = {
-            "messages": message_data,
-            "model": getattr(self._base_llm, "model_name", None),
-            "temperature": getattr(self._base_llm, "temperature", None),
-            "max_tokens": getattr(self._base_llm, "max_tokens", None),
-            "tools": kwargs.get("tools", None),
-            "tool_choice": kwargs.get("tool_choice", None)
-        }
-        
-        # Generate hash
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.sha256(cache_str.encode()).hexdigest()
+        return llm_cache_key(
+            messages,
+            self._base_llm,
+            tools=kwargs.get("tools"),
+            tool_choice=kwargs.get("tool_choice")
+        )
     
     async def _agenerate(
         self,
@@ -70,48 +108,37 @@ class CachedChatOpenAI(BaseChatModel):
         # Generate cache key
         cache_key = self._generate_cache_key(messages, **kwargs)
         
-        # Try to get from cache
-        cached_response = await cache_manager.get_cached_ai_response(
-            cache_key, 
-            getattr(self._base_llm, "model_name", "unknown")
-        )
+        # Look the key up in the background; unless it's already known to be
+        # missing, give it a short head start before asking the model
+        lookup = None
+        if cache_key not in self._known_misses:
+            lookup = asyncio.ensure_future(self._lookup_cached(cache_key))
+        generation = None
         
-        if cached_response:
-            self._cache_stats["hits"] += 1
-            logger.debug(
-                "Cache hit for AI response",
-                hit_rate=f"{self._cache_stats['hits'] / (self._cache_stats['hits'] + self._cache_stats['misses']) * 100:.1f}%"
-            )
+        try:
+            if lookup is not None:
+                await asyncio.wait({lookup}, timeout=CACHE_LOOKUP_HEAD_START)
+                if lookup.done() and lookup.result() is not None:
+                    return lookup.result()
             
-            # Deserialize the cached response
-            try:
-                cached_data = json.loads(cached_response)
-                # Reconstruct ChatResult from cached data
-                generations = [
-                    ChatGeneration(
-                        message=BaseMessage.parse_obj(gen["message"]),
-                        generation_info=gen.get("generation_info")
-                    )
-                    for gen in cached_data["generations"]
-                ]
-                
-                return ChatResult(
-                    generations=generations,
-                    llm_output=cached_data.get("llm_output")
-                )
-            except Exception as e:
-                logger.warning(f"Failed to deserialize cached response: {e}")
-                # Fall through to generate new response
-        
-        self._cache_stats["misses"] += 1
-        
-        # Generate new response
-        result = await self._base_llm._agenerate(
-            messages=messages,
-            stop=stop,
-            run_manager=run_manager,
-            **kwargs
-        )
+            # Slow lookups race the model; whichever answers first wins
+            generation = asyncio.ensure_future(self._base_llm._agenerate(
+                messages=messages,
+                stop=stop,
+                run_manager=run_manager,
+                **kwargs
+            ))
+            if lookup is not None and not lookup.done():
+                await asyncio.wait({lookup, generation}, return_when=asyncio.FIRST_COMPLETED)
+                if lookup.done() and lookup.result() is not None:
+                    return lookup.result()
+            
+            self._cache_stats["misses"] += 1
+            result = await generation
+        finally:
+            for task in (lookup, generation):
+                if task is not None and not task.done():
+                    task.cancel()
         
         # Cache the response
         try:
@@ -119,7 +146,7 @@ class CachedChatOpenAI(BaseChatModel):
             cache_data = {
                 "generations": [
                     {
-                        "message": gen.message.dict(),
+                        "message": _dump_message(gen.message),
                         "generation_info": gen.generation_info
                     }
                     for gen in result.generations
@@ -127,15 +154,56 @@ class CachedChatOpenAI(BaseChatModel):
                 "llm_output": result.llm_output
             }
             
-            await cache_manager.cache_ai_response(
+            stored = await cache_manager.cache_ai_response(
                 cache_key,
-                json.dumps(cache_data),
+                orjson.dumps(cache_data, default=str),
                 getattr(self._base_llm, "model_name", "unknown"),
                 ttl=self._cache_ttl
             )
         except Exception as e:
             logger.warning(f"Failed to cache AI response: {e}")
+            stored = False
+        
+        if stored:
+            self._known_misses.discard(cache_key)
+        else:
+            self._remember_miss(cache_key)
+        
+        return result
+    
+    async def _lookup_cached(self, cache_key: str) -> Optional[ChatResult]:
+        """Get the cached result for cache_key, or None on a miss."""
+        cached_response = await cache_manager.get_cached_ai_response(
+            cache_key, 
+            getattr(self._base_llm, "model_name", "unknown")
+        )
+        if not cached_response:
+            return None
+        
+        # Deserialize the cached response
+        try:
+            cached_data = cached_response if isinstance(cached_response, dict) else orjson.loads(cached_response)
+            # Reconstruct ChatResult from cached data
+            generations = [
+                ChatGeneration(
+                    message=_load_message(gen["message"]),
+                    generation_info=gen.get("generation_info")
+                )
+                for gen in cached_data["generations"]
+            ]
+            result = ChatResult(
+                generations=generations,
+                llm_output=cached_data.get("llm_output")
+            )
+        except Exception as e:
+            logger.warning(f"Failed to deserialize cached response: {e}")
+            return None
         
+        self._cache_stats["hits"] += 1
+        logger.debug(
+            "Cache hit for AI response",
+            hit_rate=f"{self._cache_stats['hits'] / (self._cache_stats['hits'] + self._cache_stats['misses']) * 100:.1f}%"
+        )
         return result
     
     def _generate(
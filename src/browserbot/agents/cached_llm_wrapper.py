@@ -2,38 +2,59 @@
 Simple cached LLM wrapper for performance optimization.
 """
 
-import hashlib
-import json
-from typing import List, Optional, Any, AsyncIterator, Sequence, Union
+import asyncio
+import orjson
+from typing import List, Optional, Any, AsyncIterator, Dict, Sequence, Set, Tuple, Union
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import BaseMessage, AIMessage
+from langchain_core.messages import BaseMessage, AIMessage, HumanMessage, ToolMessage
 from langchain_core.outputs import ChatResult, ChatGeneration, ChatGenerationChunk, LLMResult
 from langchain_core.callbacks import CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun
 from langchain_core.runnables import RunnableConfig
 
 from ..core.cache import cache_manager
+from ..core.disk_cache import DiskCache
 from ..core.logger import get_logger
+from ..core.semantic_cache import SemanticCache
 from ..core.progress import get_progress_manager, TaskStatus
+from .cache_keys import context_namespace, llm_cache_key
 
 logger = get_logger(__name__)
 
+# Cache writes left running in the background before a new response waits
+# for its own write instead
+MAX_PENDING_WRITES = 64
+
 
 class CachedLLMWrapper:
     """
     A simple wrapper that adds caching to any LangChain chat model.
     """
     
-    def __init__(self, base_llm: BaseChatModel, cache_ttl: int = 7200):
+    def __init__(
+        self,
+        base_llm: BaseChatModel,
+        cache_ttl: int = 7200,
+        semantic_cache: Optional[SemanticCache] = None,
+        disk_cache: Optional[DiskCache] = None
+    ):
         """
         Initialize the cached LLM wrapper.
         
         Args:
             base_llm: The underlying LLM to wrap
             cache_ttl: Cache TTL in seconds (default 2 hours)
+            semantic_cache: Optional similarity cache consulted on exact-match misses
+            disk_cache: Optional on-disk store that keeps exact-match responses across processes
         """
         self.base_llm = base_llm
         self.cache_ttl = cache_ttl
-        self._cache_stats = {"hits": 0, "misses": 0}
+        self.semantic_cache = semantic_cache
+        self.disk_cache = disk_cache
+        self._cache_stats = {"hits": 0, "misses": 0, "semantic_hits": 0}
+        # Prompt-prefix caching done by the provider itself, from usage metadata
+        self._provider_stats = {"input_tokens": 0, "cache_read_input_tokens": 0}
+        # Cache writes still running after their response was returned
+        self._pending_writes: Set[asyncio.Task] = set()
         
         # Copy essential attributes from base LLM
         for attr in ['model_name', 'temperature', 'max_tokens', 'streaming']:
@@ -42,28 +63,37 @@ class CachedLLMWrapper:
     
     def _generate_cache_key(self, messages: List[BaseMessage], **kwargs) -> str:
         """Generate a cache key from messages and parameters."""
-        # Create a stable representation of the messages
-        message_data = []
-        for msg in messages:
-            message_data.append({
-                "type": msg.__class__.__name__,
-                "content": msg.content,
-                "additional_kwargs": getattr(msg, 'additional_kwargs', {})
-            })
-        
-        # Include relevant kwargs that affect the output
-        cache_data = {
-            "messages": message_data,
-            "model": getattr(self.base_llm, "model_name", getattr(self.base_llm, "model", None)),
-            "temperature": getattr(self.base_llm, "temperature", None),
-            "max_tokens": getattr(self.base_llm, "max_tokens", None),
-            "tools": str(kwargs.get("tools", [])),
-            "tool_choice": str(kwargs.get("tool_choice", None))
-        }
+        return llm_cache_key(
+            messages,
+            self.base_llm,
+            tools=kwargs.get("tools"),
+            tool_choice=kwargs.get("tool_choice")
+        )
+    
+    def _semantic_key(
+        self,
+        messages: List[BaseMessage],
+        **kwargs
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Split messages into a (namespace, prompt) pair for the semantic cache.
         
-        # Generate hash
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.sha256(cache_str.encode()).hexdigest()
+        Only the opening turn of a task qualifies: once AI or tool messages
+        are present the answer depends on page state, not just the wording.
+        """
+        if any(isinstance(msg, (AIMessage, ToolMessage)) for msg in messages):
+            return None
+        
+        prompt = "\n".join(str(msg.content) for msg in messages if isinstance(msg, HumanMessage))
+        if not prompt:
+            return None
+        
+        namespace = context_namespace(
+            [msg for msg in messages if not isinstance(msg, HumanMessage)],
+            self.base_llm,
+            tools=kwargs.get("tools")
+        )
+        return namespace, prompt
     
     async def ainvoke(
         self,
@@ -74,7 +104,6 @@ class CachedLLMWrapper:
         """Async invoke with caching."""
         # Convert string to messages if needed
         if isinstance(input, str):
-            from langchain_core.messages import HumanMessage
             messages = [HumanMessage(content=input)]
         else:
             messages = input
@@ -85,6 +114,8 @@ class CachedLLMWrapper:
         # Try to get from cache
         model_name = getattr(self.base_llm, "model_name", getattr(self.base_llm, "model", "unknown"))
         cached_response = await cache_manager.get_cached_ai_response(cache_key, model_name)
+        if not cached_response and self.disk_cache:
+            cached_response = await self.disk_cache.get(f"{model_name}:{cache_key}")
         
         progress = get_progress_manager()
         
@@ -100,7 +131,7 @@ class CachedLLMWrapper:
             
             # Return cached message
             try:
-                cached_data = json.loads(cached_response)
+                cached_data = cached_response if isinstance(cached_response, dict) else orjson.loads(cached_response)
                 return AIMessage(
                     content=cached_data.get("content", ""),
                     additional_kwargs=cached_data.get("additional_kwargs", {})
@@ -108,28 +139,86 @@ class CachedLLMWrapper:
             except Exception as e:
                 logger.warning(f"Failed to deserialize cached response: {e}")
         
+        # Fall back to a similar earlier prompt
+        semantic_key = self._semantic_key(messages, **kwargs) if self.semantic_cache else None
+        if semantic_key:
+            similar = await self.semantic_cache.lookup(*semantic_key)
+            if similar is not None:
+                self._cache_stats["semantic_hits"] += 1
+                progress.status("Using semantically cached AI response", TaskStatus.INFO)
+                return AIMessage(
+                    content=similar.get("content", ""),
+                    additional_kwargs=similar.get("additional_kwargs", {})
+                )
+        
         self._cache_stats["misses"] += 1
         
         # Generate new response
         result = await self.base_llm.ainvoke(input, config, **kwargs)
+        self._record_usage(result)
+        
+        # Cache the response without holding it back from the caller
+        cache_data = {
+            "content": result.content,
+            "additional_kwargs": getattr(result, "additional_kwargs", {})
+        }
+        try:
+            # Serialized now, before the caller can change the message
+            serialized = orjson.dumps(cache_data)
+        except Exception as e:
+            logger.warning(f"Failed to cache AI response: {e}")
+            return result
         
-        # Cache the response
+        write = self._store_response(cache_key, model_name, serialized, cache_data, semantic_key)
+        if len(self._pending_writes) >= MAX_PENDING_WRITES:
+            # The cache is falling behind; wait rather than pile up writes
+            await write
+        else:
+            task = asyncio.ensure_future(write)
+            self._pending_writes.add(task)
+            task.add_done_callback(self._pending_writes.discard)
+        
+        return result
+    
+    async def _store_response(
+        self,
+        cache_key: str,
+        model_name: str,
+        serialized: bytes,
+        cache_data: Dict[str, Any],
+        semantic_key: Optional[Tuple[str, str]]
+    ) -> None:
+        """Write a generated response to every configured cache."""
         try:
-            cache_data = {
-                "content": result.content,
-                "additional_kwargs": getattr(result, "additional_kwargs", {})
-            }
-            
             await cache_manager.cache_ai_response(
                 cache_key,
-                json.dumps(cache_data),
+                serialized,
                 model_name,
                 ttl=self.cache_ttl
             )
+            
+            if self.disk_cache:
+                await self.disk_cache.set(f"{model_name}:{cache_key}", serialized.decode(), ttl=self.cache_ttl)
+            
+            if semantic_key:
+                await self.semantic_cache.store(*semantic_key, cache_data)
         except Exception as e:
             logger.warning(f"Failed to cache AI response: {e}")
+    
+    async def flush(self) -> None:
+        """Wait for cache writes still running in the background."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+    
+    def _record_usage(self, result: BaseMessage) -> None:
+        """Accumulate provider-reported input and cached-prefix token counts."""
+        usage = getattr(result, "usage_metadata", None)
+        if not usage:
+            return
         
-        return result
+        self._provider_stats["input_tokens"] += usage.get("input_tokens", 0)
+        details = usage.get("input_token_details") or {}
+        self._provider_stats["cache_read_input_tokens"] += details.get("cache_read", 0) or 0
     
     def invoke(self, *args, **kwargs):
         """Sync invoke delegates to base LLM."""
@@ -155,14 +244,18 @@ class CachedLLMWrapper:
     
     def get_cache_stats(self) -> dict:
         """Get cache statistics."""
-        total = self._cache_stats["hits"] + self._cache_stats["misses"]
-        hit_rate = (self._cache_stats["hits"] / total * 100) if total > 0 else 0
+        hits = self._cache_stats["hits"] + self._cache_stats["semantic_hits"]
+        total = hits + self._cache_stats["misses"]
+        hit_rate = (hits / total * 100) if total > 0 else 0
         
         return {
             "hits": self._cache_stats["hits"],
+            "semantic_hits": self._cache_stats["semantic_hits"],
             "misses": self._cache_stats["misses"],
             "total": total,
-            "hit_rate": f"{hit_rate:.1f}%"
+            "hit_rate": f"{hit_rate:.1f}%",
+            "provider_input_tokens": self._provider_stats["input_tokens"],
+            "provider_cache_read_tokens": self._provider_stats["cache_read_input_tokens"]
         }
     
     # Delegate all other method calls to the base LLM
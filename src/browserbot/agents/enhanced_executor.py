@@ -1,7 +1,9 @@
 """Enhanced tool executor with improvements from open source agents."""
 
 import json
+import random
 import re
+import orjson
 from typing import Dict, List, Any, Optional, Tuple
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -9,30 +11,27 @@ from ..core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-class EnhancedToolExecutor:
-    """Enhanced tool executor with best practices from Browser-Use, HyperAgent, and Skyvern."""
-    
-    def __init__(self, tools: Dict[str, Any], llm: BaseChatModel):
-        self.tools = tools
-        self.llm = llm
-        self.max_iterations = 15
-        self.fallback_to_playwright = True  # From HyperAgent
-        self.enable_vision = True  # From Skyvern
-        self.stealth_mode = True  # From HyperAgent
-        
-    def create_enhanced_prompt(self, task: str) -> str:
-        """Create an enhanced prompt with best practices from open source agents."""
-        
-        tool_descriptions = []
-        for name, tool in self.tools.items():
-            tool_descriptions.append(f"- {name}: {tool.description}")
-        
-        return f"""You are an advanced browser automation agent with enhanced capabilities.
+# Tool call formats found in one pass by _extract_tool_calls: fenced JSON
+# blocks, lazily up to the first closing fence (\s* around the body would
+# backtrack through an unterminated block), or else brace-free inline JSON
+# objects, filtered for "name" afterwards
+_TOOL_CALL_RE = re.compile(r'```json(?P<block>.*?)```|(?P<inline>\{[^{}]*\})', re.DOTALL)
+# Natural language instructions recognised by _parse_natural_language. Matched
+# against the lowercased response, so the patterns are lowercase themselves.
+_NL_PATTERNS = {
+    'navigate': re.compile(r'(?:go to|navigate to|open|visit)\s+(\S+)'),
+    'click': re.compile(r'(?:click on|click|press)\s+(?:the\s+)?(.+?)(?:\s+button|\s+link)?'),
+    'type': re.compile(r'(?:type|enter|input)\s+"([^"]+)"(?:\s+in(?:to)?\s+(.+?))?'),
+    'extract': re.compile(r'(?:extract|get|find|scrape)\s+(?:the\s+)?(.+?)(?:\s+from)?'),
+}
+
+# Filled in by EnhancedToolExecutor.create_enhanced_prompt
+_ENHANCED_PROMPT_TEMPLATE = """You are an advanced browser automation agent with enhanced capabilities.
 
 TASK: {task}
 
 AVAILABLE TOOLS:
-{chr(10).join(tool_descriptions)}
+{tools}
 
 ENHANCED CAPABILITIES:
 1. Vision-Based Element Detection: When traditional selectors fail, describe what you're looking for and I'll use computer vision.
@@ -62,21 +61,39 @@ IMPORTANT RULES:
 
 For tool calls, use this exact format:
 ```json
-{
+{{
   "name": "tool_name",
-  "arguments": {
+  "arguments": {{
     "param1": "value1",
     "param2": "value2"
-  }
-}
+  }}
+}}
 ```
 
 Begin by analyzing the task and executing the necessary tools."""
 
+
+class EnhancedToolExecutor:
+    """Enhanced tool executor with best practices from Browser-Use, HyperAgent, and Skyvern."""
+    
+    def __init__(self, tools: Dict[str, Any], llm: BaseChatModel):
+        self.tools = tools
+        self.llm = llm
+        self.max_iterations = 15
+        self.fallback_to_playwright = True  # From HyperAgent
+        self.enable_vision = True  # From Skyvern
+        self.stealth_mode = True  # From HyperAgent
+        # Tools are fixed per executor, so their prompt section is built once
+        self._tool_descriptions = "\n".join(
+            f"- {name}: {tool.description}" for name, tool in tools.items()
+        )
+        
+    def create_enhanced_prompt(self, task: str) -> str:
+        """Create an enhanced prompt with best practices from open source agents."""
+        return _ENHANCED_PROMPT_TEMPLATE.format(task=task, tools=self._tool_descriptions)
+
     def _add_human_like_delays(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Add human-like delays between actions (from HyperAgent)."""
-        import random
-        
         if tool_name in ['interact', 'navigate']:
             delay = random.uniform(0.5, 2.0)
             return {
@@ -90,32 +107,23 @@ Begin by analyzing the task and executing the necessary tools."""
 
     def _extract_tool_calls(self, response: str) -> List[Dict[str, Any]]:
         """Extract tool calls with multiple parsing strategies."""
-        tool_calls = []
-        
         # Strategy 1: JSON blocks (standard)
-        json_pattern = r'```json\s*(.*?)\s*```'
-        json_matches = re.findall(json_pattern, response, re.DOTALL)
-        
-        for match in json_matches:
+        # Strategy 2: Inline JSON objects (fallback, used only without blocks)
+        block_calls = []
+        inline_calls = []
+        for match in _TOOL_CALL_RE.finditer(response):
+            block = match.group('block')
+            if block is None and '"name"' not in match.group('inline'):
+                continue
+            
             try:
-                tool_call = json.loads(match.strip())
-                if isinstance(tool_call, dict) and 'name' in tool_call:
-                    tool_calls.append(tool_call)
-            except json.JSONDecodeError:
+                tool_call = orjson.loads(block if block is not None else match.group('inline'))
+            except orjson.JSONDecodeError:
                 continue
+            if isinstance(tool_call, dict) and 'name' in tool_call:
+                (block_calls if block is not None else inline_calls).append(tool_call)
         
-        # Strategy 2: Inline JSON objects (fallback)
-        if not tool_calls:
-            inline_pattern = r'\{[^{}]*"name"[^{}]*\}'
-            inline_matches = re.findall(inline_pattern, response)
-            
-            for match in inline_matches:
-                try:
-                    tool_call = json.loads(match)
-                    if 'name' in tool_call:
-                        tool_calls.append(tool_call)
-                except json.JSONDecodeError:
-                    continue
+        tool_calls = block_calls or inline_calls
         
         # Strategy 3: Natural language fallback (from Skyvern)
         if not tool_calls and self.fallback_to_playwright:
@@ -127,18 +135,10 @@ Begin by analyzing the task and executing the necessary tools."""
         """Parse natural language instructions into tool calls (from Skyvern)."""
         tool_calls = []
         
-        # Common patterns
-        patterns = {
-            'navigate': r'(?:go to|navigate to|open|visit)\s+(\S+)',
-            'click': r'(?:click on|click|press)\s+(?:the\s+)?(.+?)(?:\s+button|\s+link)?',
-            'type': r'(?:type|enter|input)\s+"([^"]+)"(?:\s+in(?:to)?\s+(.+?))?',
-            'extract': r'(?:extract|get|find|scrape)\s+(?:the\s+)?(.+?)(?:\s+from)?',
-        }
-        
         response_lower = response.lower()
         
-        for tool_name, pattern in patterns.items():
-            matches = re.finditer(pattern, response_lower, re.IGNORECASE)
+        for tool_name, pattern in _NL_PATTERNS.items():
+            matches = pattern.finditer(response_lower)
             for match in matches:
                 if tool_name == 'navigate':
                     tool_calls.append({
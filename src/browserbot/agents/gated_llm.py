@@ -0,0 +1,66 @@
+"""
+ChatOpenAI with a process-wide cap on concurrent model requests.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_openai import ChatOpenAI
+
+from ..core.concurrency import get_shared_semaphore
+from ..core.config import settings
+
+# Set only while _agenerate holds a request slot: with streaming enabled it
+# calls _astream, which must not wait for a second slot. Never set inside
+# _astream itself, since a generator's context changes leak to its consumer
+# between chunks.
+_holding_slot: ContextVar[bool] = ContextVar("_holding_llm_slot", default=False)
+
+
+def _request_slots() -> asyncio.Semaphore:
+    """Model request slots shared by every agent in the process."""
+    return get_shared_semaphore("llm", settings.max_llm_concurrency)
+
+
+class GatedChatOpenAI(ChatOpenAI):
+    """
+    ChatOpenAI that waits for a request slot before calling the provider.
+
+    Concurrent tasks and agents share ``settings.max_llm_concurrency`` slots,
+    so bursts queue locally instead of tripping provider rate limits.
+    """
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        async with _request_slots():
+            token = _holding_slot.set(True)
+            try:
+                return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            finally:
+                _holding_slot.reset(token)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        if _holding_slot.get():
+            # Streaming on behalf of _agenerate, which already holds the slot
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+            return
+
+        async with _request_slots():
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
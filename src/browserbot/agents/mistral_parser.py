@@ -3,8 +3,8 @@ Custom output parser for Mistral models to handle tool calling issues.
 """
 
 import re
-import json
 from typing import Dict, Any, Optional, Union
+import orjson
 from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers import BaseOutputParser
 from langchain_core.agents import AgentAction, AgentFinish
@@ -14,6 +14,76 @@ from ..core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Patterns tried on every response in MistralToolParser.parse. Model output
+# is untrusted input, so none of them may backtrack super-linearly over it.
+#
+# Brace-free JSON objects; each is a short candidate for _TOOL_JSON_RE, which
+# would backtrack cubically if searched over the whole response
+_FLAT_OBJECT_RE = re.compile(r'\{[^{}]*\}')
+_TOOL_JSON_RE = re.compile(r'\{[^{}]*"tool"[^{}]*:[^{}]*"([^"]+)"[^{}]*\}')
+# Pattern: toolName({ param: value }); \b stops retries from inside a word
+_CODE_CALL_RE = re.compile(r'\b(\w+)\s*\(\s*\{([^}]+)\}\s*\)')
+_PARAM_RE = re.compile(r'(\w+)\s*:\s*["\']([^"\']+)["\']')
+# Function names models use in code-like calls -> actual tool names
+_TOOL_MAPPING = {
+    'navigateTo': 'navigate',
+    'goTo': 'navigate',
+    'click': 'interact',
+    'clickElement': 'interact',
+    'typeText': 'interact',
+    'type': 'interact',
+    'extract': 'extract',
+    'getData': 'extract',
+    'takeScreenshot': 'screenshot',
+    'screenshot': 'screenshot',
+    'waitFor': 'wait',
+    'wait': 'wait'
+}
+# Parameter names models use in code-like calls -> actual argument names
+_PARAM_MAPPING = {
+    'url': 'url',
+    'href': 'url',
+    'link': 'url',
+    'element': 'selector',
+    'target': 'selector',
+    'css': 'selector',
+    'xpath': 'selector',
+    'content': 'text',
+    'value': 'text',
+    'input': 'text'
+}
+# Any one of these in the lowercased text means the model is giving its
+# final answer
+_FINAL_ANSWER_MARKERS = ("final answer:", "i have successfully", "task completed", "done.")
+# Same, as (first, then) phrases on one line, i.e. "The .* has been"
+_FINAL_ANSWER_PHRASES = (("the ", " has been"), ("i've ", " successfully"))
+# Plain-language descriptions of an action, with the tool and arguments they
+# imply. Case-insensitive patterns can't skip ahead to their first literal,
+# so each is only searched when its keyword appears in the lowercased text.
+_ACTION_PATTERNS = (
+    ("navigat", re.compile(r"navigat\w* to (.+)", re.IGNORECASE), "navigate", lambda m: {"url": m.group(1).strip()}),
+    ("go to", re.compile(r"go to (.+)", re.IGNORECASE), "navigate", lambda m: {"url": m.group(1).strip()}),
+    ("click", re.compile(r"click\w* (?:on |the )?(.+)", re.IGNORECASE), "interact", lambda m: {"action": "click", "selector": m.group(1).strip()}),
+    ("type", re.compile(r"type\w* ['\"](.+?)['\"] (?:in|into) (.+)", re.IGNORECASE), "interact", lambda m: {"action": "type", "text": m.group(1), "selector": m.group(2).strip()}),
+    ("extract", re.compile(r"extract\w* (?:data|text|content) from (.+)", re.IGNORECASE), "extract", lambda m: {"selector": m.group(1).strip()}),
+)
+# Lazy body up to the first closing fence, stripped by the caller; \s*
+# around it would backtrack through unterminated blocks
+_JSON_BLOCK_RE = re.compile(r'```json(.*?)```', re.DOTALL)
+
+
+def _looks_like_final_answer(lowered: str) -> bool:
+    """Check lowercased text for a final-answer phrase in a single linear pass per pattern."""
+    if any(marker in lowered for marker in _FINAL_ANSWER_MARKERS):
+        return True
+    
+    for line in lowered.split("\n"):
+        for first, then in _FINAL_ANSWER_PHRASES:
+            start = line.find(first)
+            if start != -1 and line.find(then, start + len(first)) != -1:
+                return True
+    return False
+
 
 class MistralToolParser(BaseOutputParser):
     """
@@ -40,7 +110,7 @@ class MistralToolParser(BaseOutputParser):
                 function_call = text.additional_kwargs['function_call']
                 return AgentAction(
                     tool=function_call["name"],
-                    tool_input=json.loads(function_call["arguments"]),
+                    tool_input=orjson.loads(function_call["arguments"]),
                     log=str(text)
                 )
             
@@ -50,14 +120,19 @@ class MistralToolParser(BaseOutputParser):
         # Now handle string text
         if isinstance(text, str):
             # Check for JSON-like tool calls in the text
-            json_pattern = r'\{[^{}]*"tool"[^{}]*:[^{}]*"([^"]+)"[^{}]*\}'
-            json_match = re.search(json_pattern, text, re.DOTALL)
+            json_match = next(
+                (
+                    candidate for candidate in _FLAT_OBJECT_RE.finditer(text)
+                    if '"tool"' in candidate.group(0) and _TOOL_JSON_RE.fullmatch(candidate.group(0))
+                ),
+                None
+            )
             
             if json_match:
                 try:
                     # Extract the JSON object
                     json_str = json_match.group(0)
-                    tool_data = json.loads(json_str)
+                    tool_data = orjson.loads(json_str)
                     
                     tool_name = tool_data.get("tool")
                     arguments = tool_data.get("arguments", {})
@@ -69,35 +144,19 @@ class MistralToolParser(BaseOutputParser):
                         tool_input=arguments,
                         log=text
                     )
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning("Failed to parse JSON tool call from text")
             
             # Check for code-like patterns that indicate tool usage
             # Pattern: toolName({ param: value })
-            code_pattern = r'(\w+)\s*\(\s*\{([^}]+)\}\s*\)'
-            code_match = re.search(code_pattern, text)
+            code_match = _CODE_CALL_RE.search(text)
             
             if code_match:
                 tool_name = code_match.group(1)
                 params_str = code_match.group(2)
                 
                 # Map common function names to actual tool names
-                tool_mapping = {
-                    'navigateTo': 'navigate',
-                    'goTo': 'navigate',
-                    'click': 'interact',
-                    'clickElement': 'interact',
-                    'typeText': 'interact',
-                    'type': 'interact',
-                    'extract': 'extract',
-                    'getData': 'extract',
-                    'takeScreenshot': 'screenshot',
-                    'screenshot': 'screenshot',
-                    'waitFor': 'wait',
-                    'wait': 'wait'
-                }
-                
-                actual_tool = tool_mapping.get(tool_name, tool_name)
+                actual_tool = _TOOL_MAPPING.get(tool_name, tool_name)
                 
                 # Parse parameters
                 try:
@@ -106,29 +165,15 @@ class MistralToolParser(BaseOutputParser):
                     params = {}
                     
                     # Simple parameter parsing
-                    param_pattern = r'(\w+)\s*:\s*["\']([^"\']+)["\']'
-                    for match in re.finditer(param_pattern, params_str):
+                    for match in _PARAM_RE.finditer(params_str):
                         key = match.group(1)
                         value = match.group(2)
                         params[key] = value
                     
                     # Map common parameter names
-                    param_mapping = {
-                        'url': 'url',
-                        'href': 'url',
-                        'link': 'url',
-                        'element': 'selector',
-                        'target': 'selector',
-                        'css': 'selector',
-                        'xpath': 'selector',
-                        'content': 'text',
-                        'value': 'text',
-                        'input': 'text'
-                    }
-                    
                     mapped_params = {}
                     for key, value in params.items():
-                        mapped_key = param_mapping.get(key, key)
+                        mapped_key = _PARAM_MAPPING.get(key, key)
                         mapped_params[mapped_key] = value
                     
                     # Add action type for interact tool
@@ -150,33 +195,18 @@ class MistralToolParser(BaseOutputParser):
                     logger.warning(f"Failed to parse code-like tool call: {e}")
             
             # Check if this looks like a final answer
-            final_answer_patterns = [
-                r"Final Answer:",
-                r"I have successfully",
-                r"Task completed",
-                r"Done\.",
-                r"The .* has been",
-                r"I've .* successfully"
-            ]
-            
-            for pattern in final_answer_patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return AgentFinish(
-                        return_values={"output": text},
-                        log=text
-                    )
+            lowered = text.lower()
+            if _looks_like_final_answer(lowered):
+                return AgentFinish(
+                    return_values={"output": text},
+                    log=text
+                )
             
             # If we can't parse it as a tool call, check if it's describing an action
-            action_patterns = [
-                (r"navigat\w* to (.+)", "navigate", lambda m: {"url": m.group(1).strip()}),
-                (r"go to (.+)", "navigate", lambda m: {"url": m.group(1).strip()}),
-                (r"click\w* (?:on |the )?(.+)", "interact", lambda m: {"action": "click", "selector": m.group(1).strip()}),
-                (r"type\w* ['\"](.+?)['\"] (?:in|into) (.+)", "interact", lambda m: {"action": "type", "text": m.group(1), "selector": m.group(2).strip()}),
-                (r"extract\w* (?:data|text|content) from (.+)", "extract", lambda m: {"selector": m.group(1).strip()}),
-            ]
-            
-            for pattern, tool, param_func in action_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for keyword, pattern, tool, param_func in _ACTION_PATTERNS:
+                if keyword not in lowered:
+                    continue
+                match = pattern.search(text)
                 if match:
                     params = param_func(match)
                     logger.info(f"Inferred tool call from description: {tool} with args {params}")
@@ -188,7 +218,7 @@ class MistralToolParser(BaseOutputParser):
                     )
             
             # Check if it shows JSON in markdown code blocks
-            markdown_json = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
+            markdown_json = _JSON_BLOCK_RE.search(text)
             if markdown_json:
                 json_content = markdown_json.group(1).strip()
                 logger.info(f"Found JSON in markdown block: {repr(json_content[:200])}")
@@ -202,11 +232,11 @@ class MistralToolParser(BaseOutputParser):
                 for obj_str in potential_objects:
                     if obj_str.startswith('{') and obj_str.endswith('}'):
                         try:
-                            tool_data = json.loads(obj_str)
+                            tool_data = orjson.loads(obj_str)
                             if "name" in tool_data and "arguments" in tool_data:
                                 json_objects.append(tool_data)
                                 logger.info(f"Successfully parsed JSON object: {tool_data['name']}")
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             logger.debug(f"Failed to parse JSON object: {obj_str[:100]}")
                             continue
                 
@@ -6,10 +6,10 @@ and converts them to actual tool executions, working around limitations in
 OpenRouter's Mistral tool calling support.
 """
 
-import json
+import orjson
 import re
 import asyncio
-from typing import Dict, Any, List, Optional, AsyncIterator
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 from datetime import datetime
 
 from langchain_core.messages import HumanMessage, AIMessage
@@ -18,12 +18,63 @@ from langchain.tools import BaseTool
 
 from .mistral_parser import MistralToolParser
 from .prompts import BrowserAgentPrompts
+from ..core.config import settings
 from ..core.logger import get_logger
 from ..core.errors import AIModelError, BrowserError
 from ..core.progress import get_progress_manager, TaskStatus, progress_task
 
 logger = get_logger(__name__)
 
+# Patterns used on every model response in _extract_tool_calls
+_NEWLINES_RE = re.compile(r'\n+')
+# Lazy body up to the first closing fence; the body is stripped afterwards, so
+# there is no \s* around it for the engine to backtrack through on an
+# unterminated block
+_JSON_BLOCK_RE = re.compile(r'```json(.*?)```', re.DOTALL)
+# Unrolled loop matching a JSON object with at most one level of nesting
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+# \b stops the name from being retried at every position inside a long word
+_FUNC_CALL_RE = re.compile(r'\b(\w+)\s*\(\s*\{([^}]+)\}\s*\)')
+
+# Tools that only read the page and may run concurrently with each other
+READ_ONLY_TOOLS = frozenset({"extract", "screenshot"})
+
+
+class _JsonObjectScanner:
+    """Find top-level JSON objects in text that arrives in pieces."""
+    
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape_next = False
+    
+    def feed(self, text: str) -> List[str]:
+        """Consume the next piece of text and return the objects it completed."""
+        completed = []
+        for char in text:
+            if self._depth == 0 and char != '{':
+                continue
+            self._buffer.append(char)
+            
+            if self._escape_next:
+                self._escape_next = False
+            elif self._in_string:
+                if char == '\\':
+                    self._escape_next = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == '{':
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    completed.append(''.join(self._buffer))
+                    self._buffer = []
+        return completed
+
 
 class MistralToolExecutor:
     """
@@ -34,16 +85,20 @@ class MistralToolExecutor:
     executes them manually.
     """
     
-    def __init__(self, tools: List[BaseTool], llm):
+    def __init__(self, tools: List[BaseTool], llm, dispatch_while_streaming: bool = False):
         """
         Initialize the Mistral tool executor.
         
         Args:
             tools: List of available browser automation tools
             llm: The language model instance
+            dispatch_while_streaming: Stream responses and start read-only tool
+                calls as soon as they have been written, instead of after the
+                whole response
         """
         self.tools = {tool.name: tool for tool in tools}
         self.llm = llm
+        self.dispatch_while_streaming = dispatch_while_streaming
         self.parser = MistralToolParser()
         
         logger.info(
@@ -92,10 +147,17 @@ class MistralToolExecutor:
                 progress.status(f"AI thinking (step {iteration}/{max_iterations})...", TaskStatus.INFO)
                 
                 # Get response from LLM
-                response = await self._get_llm_response(current_context)
+                dispatched: List[asyncio.Task] = []
+                held_back: List[Dict[str, Any]] = []
+                if self.dispatch_while_streaming:
+                    response, dispatched, held_back = await self._stream_and_dispatch(current_context)
+                else:
+                    response = await self._get_llm_response(current_context)
                 
                 # Check if this is a final answer
                 if self._is_final_answer(response):
+                    for task in dispatched:
+                        task.cancel()
                     logger.info("Mistral provided final answer", iteration=iteration)
                     progress.status("AI has completed the task", TaskStatus.SUCCESS)
                     return {
@@ -105,6 +167,16 @@ class MistralToolExecutor:
                         "iterations": iteration
                     }
                 
+                if dispatched:
+                    # Read-only calls already started while the response streamed
+                    # in; the calls from the first page-changing one on run now
+                    outcomes = list(await asyncio.gather(*dispatched))
+                    outcomes.extend(await self._execute_tool_calls(held_back))
+                    for tool_call, tool_result, context_update in outcomes:
+                        intermediate_steps.append((tool_call, tool_result))
+                        current_context += context_update
+                    continue
+                
                 progress.status("Parsing AI tool requests...", TaskStatus.RUNNING)
                 
                 # Parse tool calls from response
@@ -136,44 +208,9 @@ class MistralToolExecutor:
                     }
                 
                 # Execute tool calls
-                for tool_call in tool_calls:
-                    tool_name = tool_call.get("name") or tool_call.get("tool")
-                    tool_args = tool_call.get("arguments", {})
-                    
-                    if tool_name not in self.tools:
-                        error_msg = f"Unknown tool: {tool_name}"
-                        logger.warning(error_msg)
-                        intermediate_steps.append((tool_call, f"Error: {error_msg}"))
-                        continue
-                    
-                    # Execute the tool
-                    try:
-                        logger.debug(f"Executing tool: {tool_name}", args=tool_args)
-                        
-                        async with progress_task(f"Executing action: {tool_name}..."):
-                            tool_result = await self.tools[tool_name]._arun(tool_args)
-                        
-                        intermediate_steps.append((tool_call, tool_result))
-                        
-                        # Update context with tool result
-                        # Special handling for extract tool to ensure AI uses actual data
-                        if tool_name == "extract" and isinstance(tool_result, dict):
-                            if tool_result.get("success") and "data" in tool_result:
-                                data = tool_result.get("data", [])
-                                if isinstance(data, list) and len(data) > 0:
-                                    current_context += f"\n\nTool {tool_name} executed successfully and extracted {len(data)} items. The actual extracted data is: {tool_result}\n\nIMPORTANT: Use ONLY this extracted data in your response. Do NOT make up or invent any data.\n\nContinue with the task or provide the final answer:"
-                                else:
-                                    current_context += f"\n\nTool {tool_name} executed but returned no data or empty result: {tool_result}\n\nThe extraction found no matching elements. Try a different selector or report that no data was found.\n\nContinue with the task or provide the final answer:"
-                            else:
-                                current_context += f"\n\nTool {tool_name} failed: {tool_result}\n\nThe extraction was not successful. Try a different approach or report the issue.\n\nContinue with the task or provide the final answer:"
-                        else:
-                            current_context += f"\n\nTool {tool_name} executed with result: {tool_result}\n\nContinue with the task or provide the final answer:"
-                        
-                    except Exception as e:
-                        error_msg = f"Tool execution failed: {str(e)}"
-                        logger.error(error_msg, tool=tool_name, error=str(e))
-                        intermediate_steps.append((tool_call, f"Error: {error_msg}"))
-                        current_context += f"\n\nTool {tool_name} failed with error: {error_msg}\n\nTry a different approach or provide the final answer:"
+                for tool_call, tool_result, context_update in await self._execute_tool_calls(tool_calls):
+                    intermediate_steps.append((tool_call, tool_result))
+                    current_context += context_update
             
             # Max iterations reached
             logger.warning("Max iterations reached", iterations=max_iterations)
@@ -195,6 +232,85 @@ class MistralToolExecutor:
                 "error": str(e)
             }
     
+    async def _execute_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], Any, str]]:
+        """
+        Execute the tool calls from one response, overlapping independent ones.
+        
+        Calls that change the page run alone and in order, since every later
+        call depends on the state they leave behind. Consecutive read-only
+        calls between them don't depend on each other, so they run
+        concurrently, at most settings.max_parallel_tools at a time.
+        
+        Args:
+            tool_calls: Parsed tool calls in the order the model emitted them
+            
+        Returns:
+            (tool_call, result, context_update) for each call, in emitted order
+        """
+        semaphore = asyncio.Semaphore(settings.max_parallel_tools)
+        
+        async def run_bounded(tool_call: Dict[str, Any]) -> Tuple[Dict[str, Any], Any, str]:
+            async with semaphore:
+                return await self._execute_tool_call(tool_call)
+        
+        outcomes = []
+        read_only_batch = []
+        for tool_call in tool_calls:
+            if (tool_call.get("name") or tool_call.get("tool")) in READ_ONLY_TOOLS:
+                read_only_batch.append(tool_call)
+                continue
+            
+            if read_only_batch:
+                outcomes.extend(await asyncio.gather(*map(run_bounded, read_only_batch)))
+                read_only_batch = []
+            outcomes.append(await self._execute_tool_call(tool_call))
+        
+        if read_only_batch:
+            outcomes.extend(await asyncio.gather(*map(run_bounded, read_only_batch)))
+        
+        return outcomes
+    
+    async def _execute_tool_call(self, tool_call: Dict[str, Any]) -> Tuple[Dict[str, Any], Any, str]:
+        """Execute one tool call and describe its outcome for the model's context."""
+        tool_name = tool_call.get("name") or tool_call.get("tool")
+        tool_args = tool_call.get("arguments", {})
+        
+        if tool_name not in self.tools:
+            error_msg = f"Unknown tool: {tool_name}"
+            logger.warning(error_msg)
+            return tool_call, f"Error: {error_msg}", ""
+        
+        # Execute the tool
+        try:
+            logger.debug(f"Executing tool: {tool_name}", args=tool_args)
+            
+            async with progress_task(f"Executing action: {tool_name}..."):
+                tool_result = await self.tools[tool_name]._arun(tool_args)
+            
+            # Update context with tool result
+            # Special handling for extract tool to ensure AI uses actual data
+            if tool_name == "extract" and isinstance(tool_result, dict):
+                if tool_result.get("success") and "data" in tool_result:
+                    data = tool_result.get("data", [])
+                    if isinstance(data, list) and len(data) > 0:
+                        context_update = f"\n\nTool {tool_name} executed successfully and extracted {len(data)} items. The actual extracted data is: {tool_result}\n\nIMPORTANT: Use ONLY this extracted data in your response. Do NOT make up or invent any data.\n\nContinue with the task or provide the final answer:"
+                    else:
+                        context_update = f"\n\nTool {tool_name} executed but returned no data or empty result: {tool_result}\n\nThe extraction found no matching elements. Try a different selector or report that no data was found.\n\nContinue with the task or provide the final answer:"
+                else:
+                    context_update = f"\n\nTool {tool_name} failed: {tool_result}\n\nThe extraction was not successful. Try a different approach or report the issue.\n\nContinue with the task or provide the final answer:"
+            else:
+                context_update = f"\n\nTool {tool_name} executed with result: {tool_result}\n\nContinue with the task or provide the final answer:"
+            
+            return tool_call, tool_result, context_update
+            
+        except Exception as e:
+            error_msg = f"Tool execution failed: {str(e)}"
+            logger.error(error_msg, tool=tool_name, error=str(e))
+            return tool_call, f"Error: {error_msg}", f"\n\nTool {tool_name} failed with error: {error_msg}\n\nTry a different approach or provide the final answer:"
+    
     async def _get_llm_response(self, prompt: str) -> str:
         """Get response from the language model."""
         progress = get_progress_manager()
@@ -211,6 +327,85 @@ class MistralToolExecutor:
             logger.error("LLM invocation failed", error=str(e))
             raise AIModelError(f"Failed to get LLM response: {e}")
     
+    async def _stream_and_dispatch(
+        self,
+        prompt: str
+    ) -> Tuple[str, List[asyncio.Task], List[Dict[str, Any]]]:
+        """
+        Stream a model response, starting read-only tool calls as soon as their JSON closes.
+        
+        Reads then run while the model is still writing the rest of its
+        response. Each call waits for the one before it, so calls still take
+        effect in the order they were written. Only read-only tools are started
+        early: the response may yet turn out to be a final answer, which must
+        not leave page changes behind. From the first page-changing call on,
+        calls are held back for the caller to run once the response is complete.
+        Nothing is dispatched once the text so far reads as a final answer.
+        
+        Args:
+            prompt: Full prompt for this step
+            
+        Returns:
+            The complete response, the tasks started for its tool calls and the
+            tool calls held back, each in order
+        """
+        progress = get_progress_manager()
+        scanner = _JsonObjectScanner()
+        parts: List[str] = []
+        tasks: List[asyncio.Task] = []
+        held_back: List[Dict[str, Any]] = []
+        
+        try:
+            async with progress_task("Waiting for AI response..."):
+                async for chunk in self.llm.astream([HumanMessage(content=prompt)]):
+                    text = chunk.content if isinstance(chunk.content, str) else ""
+                    parts.append(text)
+                    
+                    for json_str in scanner.feed(text):
+                        tool_call = self._parse_tool_call(json_str)
+                        if tool_call is None or self._is_final_answer("".join(parts)):
+                            continue
+                        if held_back or tool_call["name"] not in READ_ONLY_TOOLS:
+                            held_back.append(tool_call)
+                            continue
+                        previous = tasks[-1] if tasks else None
+                        tasks.append(asyncio.create_task(self._execute_after(previous, tool_call)))
+        except Exception as e:
+            for task in tasks:
+                task.cancel()
+            progress.status(f"AI response failed: {str(e)}", TaskStatus.FAILED)
+            logger.error("LLM streaming failed", error=str(e))
+            raise AIModelError(f"Failed to get LLM response: {e}")
+        
+        return "".join(parts), tasks, held_back
+    
+    async def _execute_after(
+        self,
+        previous: Optional[asyncio.Task],
+        tool_call: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Any, str]:
+        """Execute a tool call once the previously dispatched one has finished."""
+        if previous is not None:
+            await asyncio.wait({previous})
+        return await self._execute_tool_call(tool_call)
+    
+    def _parse_tool_call(self, json_str: str) -> Optional[Dict[str, Any]]:
+        """Parse one JSON object into a tool call, or None if it isn't one."""
+        try:
+            parsed = orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(parsed, dict):
+            return None
+        
+        tool_name = parsed.get("name") or parsed.get("tool")
+        if not tool_name:
+            return None
+        return {
+            "name": tool_name,
+            "arguments": self._normalize_tool_arguments(tool_name, parsed.get("arguments", {}))
+        }
+    
     def _extract_tool_calls(self, response: str) -> List[Dict[str, Any]]:
         """
         Extract tool calls from Mistral's text response.
@@ -265,7 +460,7 @@ class MistralToolExecutor:
                     if json_str:
                         logger.debug(f"Attempting to parse extracted JSON: {repr(json_str[:100])}")
                         try:
-                            parsed = json.loads(json_str)
+                            parsed = orjson.loads(json_str)
                             if "name" in parsed:
                                 args = self._normalize_tool_arguments(parsed["name"], parsed.get("arguments", {}))
                                 tool_calls.append({
@@ -280,7 +475,7 @@ class MistralToolExecutor:
                                     "arguments": args
                                 })
                                 logger.debug(f"Successfully parsed raw tool call: {parsed['tool']}")
-                        except json.JSONDecodeError as e:
+                        except orjson.JSONDecodeError as e:
                             logger.warning(
                                 "Failed to parse JSON tool call",
                                 json_text=json_str[:200],
@@ -295,12 +490,12 @@ class MistralToolExecutor:
             
             # Method 2: Fallback to splitting by newlines (single or double)
             # Split by any newline pattern and filter out empty strings
-            json_objects = [obj.strip() for obj in re.split(r'\n+', response) if obj.strip() and obj.strip().startswith('{')]
+            json_objects = [obj.strip() for obj in _NEWLINES_RE.split(response) if obj.strip() and obj.strip().startswith('{')]
             
             for j, json_obj in enumerate(json_objects):
                 logger.debug(f"Attempting to parse split JSON object {j}: {repr(json_obj[:100])}")
                 try:
-                    parsed = json.loads(json_obj)
+                    parsed = orjson.loads(json_obj)
                     if "name" in parsed:
                         args = self._normalize_tool_arguments(parsed["name"], parsed.get("arguments", {}))
                         tool_calls.append({
@@ -315,14 +510,13 @@ class MistralToolExecutor:
                             "arguments": args
                         })
                         logger.debug(f"Successfully parsed raw tool call: {parsed['tool']}")
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.debug(f"Failed to parse split JSON object {j}: {json_obj[:100]}", error=str(e))
                     continue
         
         # Pattern 2: JSON in markdown code blocks (enhanced to handle multiple objects)
         if not tool_calls:
-            json_block_pattern = r'```json\s*(.*?)\s*```'
-            block_matches = re.findall(json_block_pattern, response, re.DOTALL)
+            block_matches = _JSON_BLOCK_RE.findall(response)
             
             logger.debug(f"Found {len(block_matches)} JSON code blocks")
             
@@ -338,7 +532,7 @@ class MistralToolExecutor:
                 for j, json_obj in enumerate(json_objects):
                     logger.debug(f"Attempting to parse object {j}: {repr(json_obj[:100])}")
                     try:
-                        parsed = json.loads(json_obj)
+                        parsed = orjson.loads(json_obj)
                         if "name" in parsed:
                             args = self._normalize_tool_arguments(parsed["name"], parsed.get("arguments", {}))
                             tool_calls.append({
@@ -353,7 +547,7 @@ class MistralToolExecutor:
                                 "arguments": args
                             })
                             logger.debug(f"Successfully parsed tool call: {parsed['tool']}")
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         logger.debug(f"Failed to parse JSON object {j}: {json_obj[:100]}", error=str(e))
                         continue
             
@@ -361,13 +555,12 @@ class MistralToolExecutor:
             if not tool_calls and block_matches:
                 for block in block_matches:
                     # Find individual JSON objects using regex
-                    json_obj_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-                    json_objects = re.findall(json_obj_pattern, block)
+                    json_objects = _JSON_OBJECT_RE.findall(block)
                     
                     for obj_str in json_objects:
                         if '"name"' in obj_str or '"tool"' in obj_str:
                             try:
-                                parsed = json.loads(obj_str)
+                                parsed = orjson.loads(obj_str)
                                 if "name" in parsed:
                                     args = self._normalize_tool_arguments(parsed["name"], parsed.get("arguments", {}))
                                     tool_calls.append({
@@ -380,19 +573,18 @@ class MistralToolExecutor:
                                         "name": parsed["tool"],
                                         "arguments": args
                                     })
-                            except json.JSONDecodeError:
+                            except orjson.JSONDecodeError:
                                 continue
         
         # Pattern 3: Multiple JSON objects outside code blocks
         if not tool_calls:
             # Look for curly braces and try to extract JSON objects
-            brace_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-            potential_objects = re.findall(brace_pattern, response)
+            potential_objects = _JSON_OBJECT_RE.findall(response)
             
             for obj_str in potential_objects:
                 if '"name"' in obj_str or '"tool"' in obj_str:
                     try:
-                        parsed = json.loads(obj_str)
+                        parsed = orjson.loads(obj_str)
                         if "name" in parsed:
                             args = self._normalize_tool_arguments(parsed["name"], parsed.get("arguments", {}))
                             tool_calls.append({
@@ -405,13 +597,12 @@ class MistralToolExecutor:
                                 "name": parsed["tool"],
                                 "arguments": args
                             })
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
         
         # Pattern 4: Function-like calls (fallback)
         if not tool_calls:
-            func_pattern = r'(\w+)\s*\(\s*\{([^}]+)\}\s*\)'
-            matches = re.findall(func_pattern, response)
+            matches = _FUNC_CALL_RE.findall(response)
             
             for tool_name, args_str in matches:
                 tool_mapping = {
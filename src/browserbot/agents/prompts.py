@@ -2,6 +2,7 @@
 Prompts and templates for the browser agent AI system.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, List
 from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate, MessagesPlaceholder
 from langchain_core.messages import SystemMessage
@@ -106,10 +107,29 @@ Please provide:
 Format the response as structured data (JSON) when possible."""
 
     @classmethod
-    def get_system_prompt(cls) -> ChatPromptTemplate:
-        """Get the main system prompt for OpenAI tools agent."""
+    @lru_cache(maxsize=4)
+    def get_system_prompt(cls, cache_control: bool = False) -> ChatPromptTemplate:
+        """
+        Get the main system prompt for OpenAI tools agent.
+        
+        The template is built once per variant and shared; callers must not
+        modify it.
+        
+        Args:
+            cache_control: Mark the system prompt as a cacheable prefix for
+                providers that need it explicitly (Anthropic, Gemini)
+        """
+        if cache_control:
+            system = SystemMessage(content=[{
+                "type": "text",
+                "text": cls.SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"}
+            }])
+        else:
+            system = ("system", cls.SYSTEM_PROMPT)
+        
         return ChatPromptTemplate.from_messages([
-            ("system", cls.SYSTEM_PROMPT),
+            system,
             MessagesPlaceholder(variable_name="chat_history", optional=True),
             ("human", "{input}"),
             MessagesPlaceholder(variable_name="agent_scratchpad")
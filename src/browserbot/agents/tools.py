@@ -2,8 +2,9 @@
 LangChain tools for browser automation.
 """
 
-from typing import Dict, Any, List, Optional, Union, Type
+from typing import ClassVar, Dict, Any, List, Optional, Union, Type
 import asyncio
+import base64
 from abc import ABC, abstractmethod
 from pydantic import BaseModel, Field, ConfigDict
 import json
@@ -74,6 +75,8 @@ class ScreenshotInput(BrowserToolInput):
     """Input for screenshot operations."""
     full_page: bool = Field(default=False, description="Take full page screenshot")
     element_selector: Optional[str] = Field(default=None, description="Take screenshot of specific element")
+    image_type: str = Field(default="jpeg", description="Image format (jpeg or png)")
+    quality: int = Field(default=70, description="JPEG quality (0-100)")
 
 
 class BrowserTool(BaseTool, ABC):
@@ -86,6 +89,11 @@ class BrowserTool(BaseTool, ABC):
     # Note: We don't exclude it since it's needed for the tool to function
     page_controller: PageController = Field(default=None)
     
+    # Start likely page reads once this tool returns, while the model decides
+    speculative_reads: bool = Field(default=False)
+    # Whether running the tool can leave the page in a new state
+    changes_page: ClassVar[bool] = False
+    
     def _run(self, *args, **kwargs) -> str:
         """Synchronous run method (not used for async tools)."""
         raise NotImplementedError("Use async_run for browser tools")
@@ -111,6 +119,9 @@ class BrowserTool(BaseTool, ABC):
             # Execute the tool
             result = await self.execute(parsed_input)
             
+            if self.speculative_reads and self.changes_page:
+                speculate_reads(self.page_controller)
+            
             # Log the action
             if run_manager:
                 run_manager.on_tool_end(str(result))
@@ -136,6 +147,7 @@ class NavigationTool(BrowserTool):
     """Tool for page navigation."""
     
     name: str = "navigate"
+    changes_page: ClassVar[bool] = True
     description: str = "Navigate to a specific URL. Use this to go to websites or change pages."
     args_schema: Type[BaseModel] = NavigationInput
     
@@ -173,6 +185,7 @@ class InteractionTool(BrowserTool):
     """Tool for element interactions (click, type, select)."""
     
     name: str = "interact"
+    changes_page: ClassVar[bool] = True
     description: str = "Interact with web elements - click buttons, type text, select options, etc."
     
     class InteractionInput(BrowserToolInput):
@@ -335,24 +348,26 @@ class ScreenshotTool(BrowserTool):
         try:
             screenshot_data = await self.page_controller.take_screenshot(
                 full_page=tool_input.full_page,
-                element_selector=tool_input.element_selector
+                element_selector=tool_input.element_selector,
+                image_type=tool_input.image_type,
+                quality=tool_input.quality
             )
             
-            # Convert to base64 for transport
-            import base64
-            screenshot_b64 = base64.b64encode(screenshot_data).decode()
+            # Convert to base64 for transport; ASCII decoding skips the UTF-8 validation pass
+            screenshot_b64 = base64.b64encode(screenshot_data).decode("ascii")
             
             return {
                 "success": True,
                 "action": "screenshot",
                 "full_page": tool_input.full_page,
                 "element_selector": tool_input.element_selector,
+                "image_type": tool_input.image_type,
                 "screenshot_size": len(screenshot_data),
                 "screenshot_b64": screenshot_b64,
                 "message": "Screenshot taken successfully"
             }
             
-        except BrowserError as e:
+        except (BrowserError, ValidationError) as e:
             return {
                 "success": False,
                 "action": "screenshot",
@@ -365,6 +380,7 @@ class WaitTool(BrowserTool):
     """Tool for waiting and page state management."""
     
     name: str = "wait"
+    changes_page: ClassVar[bool] = True
     description: str = "Wait for specific conditions or elements on the page."
     
     class WaitInput(BrowserToolInput):
@@ -405,6 +421,9 @@ class WaitTool(BrowserTool):
             else:
                 raise ValidationError(f"Unknown wait type: {tool_input.wait_type}")
             
+            # Whatever was waited for, the page may have moved on meanwhile
+            self.page_controller.mark_page_changed()
+            
             return {
                 "success": success,
                 "action": "wait",
@@ -424,20 +443,65 @@ class WaitTool(BrowserTool):
             }
 
 
-def create_browser_tools(page_controller: PageController) -> List[BrowserTool]:
+def create_browser_tools(
+    page_controller: PageController,
+    speculative_reads: bool = False
+) -> List[BrowserTool]:
     """
     Create all browser automation tools.
     
     Args:
         page_controller: PageController instance
+        speculative_reads: Speculate page reads after tools that change the page
         
     Returns:
         List of browser tools
     """
     return [
-        NavigationTool(page_controller=page_controller),
-        InteractionTool(page_controller=page_controller),
-        ExtractionTool(page_controller=page_controller),
-        ScreenshotTool(page_controller=page_controller),
-        WaitTool(page_controller=page_controller)
-    ]
\ No newline at end of file
+        NavigationTool(page_controller=page_controller, speculative_reads=speculative_reads),
+        InteractionTool(page_controller=page_controller, speculative_reads=speculative_reads),
+        ExtractionTool(page_controller=page_controller, speculative_reads=speculative_reads),
+        ScreenshotTool(page_controller=page_controller, speculative_reads=speculative_reads),
+        WaitTool(page_controller=page_controller, speculative_reads=speculative_reads)
+    ]
+
+
+# Keeps speculative reads alive until they finish
+_speculative_reads: set = set()
+
+
+def _finish_speculative_read(task: asyncio.Task) -> None:
+    _speculative_reads.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Speculative read failed", error=str(task.exception()))
+
+
+def speculate_reads(page_controller: PageController) -> None:
+    """
+    Start the read-only tool calls the model is likely to make next.
+    
+    Results land in the page controller's snapshot cache, so a matching
+    tool call is served from it (or joins the read still in flight). If the
+    model acts on the page instead, the cache is invalidated and the
+    speculative result is simply never used.
+    
+    Args:
+        page_controller: Controller of the page the agent is working on
+    """
+    if not page_controller.enable_caching:
+        return
+    
+    screenshot = ScreenshotInput()
+    for coro in (
+        page_controller.get_page_info(),
+        page_controller.take_screenshot(
+            full_page=screenshot.full_page,
+            element_selector=screenshot.element_selector,
+            image_type=screenshot.image_type,
+            quality=screenshot.quality
+        )
+    ):
+        task = asyncio.ensure_future(coro)
+        _speculative_reads.add(task)
+        task.add_done_callback(_finish_speculative_read)
+
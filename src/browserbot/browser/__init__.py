@@ -2,11 +2,13 @@
 
 from .browser_manager import BrowserManager
 from .page_controller import PageController
+from .shared_chromium import SharedChromium
 from .stealth import StealthConfig, apply_stealth_settings
 
 __all__ = [
     "BrowserManager",
     "PageController", 
+    "SharedChromium",
     "StealthConfig",
     "apply_stealth_settings"
 ]
\ No newline at end of file
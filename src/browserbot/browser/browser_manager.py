@@ -3,6 +3,8 @@ Browser instance management with connection pooling and lifecycle control.
 """
 
 import asyncio
+import copy
+import time
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
@@ -22,10 +24,14 @@ from ..core.logger import get_logger
 from ..core.errors import BrowserError, ConfigurationError
 from ..core.retry import with_retry, CircuitBreaker, CircuitBreakerConfig
 from ..core.progress import get_progress_manager, TaskStatus, progress_task
+from .page_controller import get_snapshot_cache_stats
 from .stealth import StealthConfig, apply_stealth_settings, create_browser_args, get_random_viewport
 
 logger = get_logger(__name__)
 
+# get_stats() results are reused for this long (seconds) unless the pool changes
+STATS_TTL = 0.5
+
 
 class BrowserInstance:
     """Represents a single browser instance with its metadata."""
@@ -64,7 +70,8 @@ class BrowserManager:
         max_browsers: int = None,
         stealth_config: Optional[StealthConfig] = None,
         min_warm_browsers: int = 2,
-        enable_caching: bool = True
+        enable_caching: bool = True,
+        cdp_endpoint: Optional[str] = None
     ):
         self.max_browsers = max_browsers or settings.max_concurrent_browsers
         self.min_warm_browsers = min(min_warm_browsers, self.max_browsers)
@@ -84,6 +91,9 @@ class BrowserManager:
         )
         self._initialized = False
         self.enable_caching = enable_caching
+        self.cdp_endpoint = cdp_endpoint  # Attach to an existing Chromium instead of launching
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
         
         # Initialize cache manager if enabled
         if self.enable_caching:
@@ -169,6 +179,7 @@ class BrowserManager:
             await self.initialize()
         
         instance = await self._get_or_create_browser()
+        self._invalidate_stats()
         
         try:
             # Create a new context with stealth settings
@@ -185,6 +196,7 @@ class BrowserManager:
             
             # Update instance usage
             instance.update_usage()
+            self._invalidate_stats()
     
     @asynccontextmanager
     async def get_page(
@@ -284,6 +296,7 @@ class BrowserManager:
             
             instance = BrowserInstance(browser, instance_id)
             self.browsers[instance_id] = instance
+            self._invalidate_stats()
             
             logger.info(
                 "Browser instance created",
@@ -308,6 +321,11 @@ class BrowserManager:
         
         progress = get_progress_manager()
         
+        if self.cdp_endpoint:
+            # Closing a CDP-connected browser only disconnects and drops our contexts
+            async with progress_task("Connecting to shared browser..."):
+                return await self.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+        
         browser_config = settings.get_browser_config()
         browser_config["args"] = create_browser_args(stealth=True)
         
@@ -394,6 +412,7 @@ class BrowserManager:
         instance = self.browsers.pop(instance_id, None)
         if not instance:
             return
+        self._invalidate_stats()
         
         try:
             # Close all contexts
@@ -495,8 +514,23 @@ class BrowserManager:
             except Exception as e:
                 logger.error("Error in warmup loop", error=str(e))
     
+    def _invalidate_stats(self) -> None:
+        """Drop the memoized get_stats() result after the pool changes."""
+        self._stats_cache = None
+    
     def get_stats(self) -> Dict[str, Any]:
-        """Get browser manager statistics."""
+        """
+        Get browser manager statistics.
+        
+        Results are memoized for STATS_TTL seconds so tight monitoring loops
+        don't rebuild them on every call; acquiring, releasing, creating or
+        closing a browser invalidates the memo. Callers get their own copy,
+        since results embed it and may be mutated.
+        """
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cached_at < STATS_TTL:
+            return copy.deepcopy(self._stats_cache)
+        
         stats = {
             "active_browsers": len(self.browsers),
             "warm_browsers": len(self.warm_browsers),
@@ -512,11 +546,14 @@ class BrowserManager:
                     "is_connected": instance.browser.is_connected(),
                 }
                 for instance in self.browsers.values()
-            ]
+            ],
+            "snapshot_cache": get_snapshot_cache_stats()
         }
         
         # Add cache stats if enabled
         if self.enable_caching and hasattr(self, '_cache_manager'):
             stats["cache_stats"] = self._cache_manager.get_stats()
-            
-        return stats
\ No newline at end of file
+        
+        self._stats_cache = stats
+        self._stats_cached_at = now
+        return copy.deepcopy(stats)
\ No newline at end of file
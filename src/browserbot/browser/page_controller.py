@@ -4,7 +4,7 @@ High-level page interactions and element management for browser automation.
 
 import asyncio
 import random
-from typing import Optional, Dict, Any, List, Union, Tuple
+from typing import Optional, Dict, Any, List, Union, Tuple, Callable, Awaitable, Hashable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -17,6 +17,14 @@ from ..core.progress import get_progress_manager, TaskStatus, progress_task
 
 logger = get_logger(__name__)
 
+# Page snapshot cache hit/miss counts across all controllers in the process
+_snapshot_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_snapshot_cache_stats() -> Dict[str, int]:
+    """Get process-wide hit/miss counts of the page snapshot cache."""
+    return dict(_snapshot_cache_stats)
+
 
 class WaitStrategy(Enum):
     """Different wait strategies for element interactions."""
@@ -61,11 +69,85 @@ class PageController:
         self.enable_caching = enable_caching
         self.reduce_delays = reduce_delays
         
+        # Non-empty results of get_all_text/get_all_attributes keyed by
+        # (selector, attribute), valid until the main frame navigates, we
+        # interact with the page or wait for it to change
+        self._selector_cache: Dict[Tuple[str, Optional[str]], List[str]] = {}
+        
+        # Page snapshots (screenshots, page info, structured data) keyed on
+        # (kind, args, frame, url, mutation tick); the tick is bumped whenever
+        # the page may have changed, which orphans every earlier entry
+        self._snapshot_cache: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._mutation_tick = 0
+        
+        page.on("framenavigated", self._on_frame_navigated)
+        page.on("load", self._on_load)
+        
         # Initialize cache manager if enabled
         if self.enable_caching:
             from ..core.cache import cache_manager
             self._cache_manager = cache_manager
     
+    def _on_frame_navigated(self, frame) -> None:
+        """Drop cached page state when the main frame navigates."""
+        if frame == self.page.main_frame:
+            self._invalidate_page_caches()
+    
+    def _on_load(self, page) -> None:
+        """Drop cached page state once a load finishes."""
+        self._invalidate_page_caches()
+    
+    def _invalidate_page_caches(self) -> None:
+        """Forget everything cached about the page after it may have changed."""
+        self._selector_cache.clear()
+        self._snapshot_cache.clear()
+        self._mutation_tick += 1
+    
+    def mark_page_changed(self) -> None:
+        """Drop cached page state after the page may have changed on its own, e.g. during a wait."""
+        self._invalidate_page_caches()
+    
+    async def _cached_snapshot(
+        self,
+        kind: str,
+        args: Tuple,
+        produce: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return a snapshot of the page, reusing the last one if the page is unchanged.
+        
+        Args:
+            kind: Snapshot type, e.g. "screenshot"
+            args: Arguments that distinguish snapshots of the same kind
+            produce: Coroutine function that takes a fresh snapshot
+            
+        Returns:
+            Cached or freshly taken snapshot
+        """
+        if not self.enable_caching:
+            return await produce()
+        
+        key = (kind, args, id(self.page.main_frame), self.page.url, self._mutation_tick)
+        # Entries are tasks, so a caller arriving while a snapshot is still
+        # being taken (e.g. by a speculative read) waits for it instead of
+        # taking another. Invalidation clears the dict, so a snapshot whose
+        # page changed under it is never served.
+        task = self._snapshot_cache.get(key)
+        if task is not None:
+            _snapshot_cache_stats["hits"] += 1
+        else:
+            _snapshot_cache_stats["misses"] += 1
+            task = asyncio.ensure_future(produce())
+            self._snapshot_cache[key] = task
+        
+        try:
+            # Shielded so one cancelled caller doesn't abort a shared snapshot
+            return await asyncio.shield(task)
+        except Exception:
+            if self._snapshot_cache.get(key) is task:
+                del self._snapshot_cache[key]
+            raise
+    
     # Navigation methods
     
     @with_retry(max_attempts=3, exceptions=(PlaywrightError, BrowserError))
@@ -202,6 +284,8 @@ class PageController:
                 elif wait_strategy == WaitStrategy.STABLE:
                     await self._wait_for_element_stable(locator.first)
             
+            # Content may have appeared or changed while waiting
+            self._selector_cache.clear()
             return locator
             
         except PlaywrightError:
@@ -227,6 +311,7 @@ class PageController:
         Returns:
             ActionResult with click details
         """
+        self._invalidate_page_caches()
         progress = get_progress_manager()
         
         try:
@@ -299,6 +384,7 @@ class PageController:
         Returns:
             ActionResult with typing details
         """
+        self._invalidate_page_caches()
         progress = get_progress_manager()
         
         try:
@@ -365,6 +451,7 @@ class PageController:
         Returns:
             ActionResult with selection details
         """
+        self._invalidate_page_caches()
         try:
             element = await self.find_element(selector)
             if not element:
@@ -424,6 +511,10 @@ class PageController:
     
     async def get_all_text(self, selector: str) -> List[str]:
         """Get text content from all elements matching the selector."""
+        cached = self._selector_cache.get((selector, None)) if self.enable_caching else None
+        if cached is not None:
+            return list(cached)
+        
         try:
             elements = await self.page.locator(selector).all()
             texts = []
@@ -431,7 +522,10 @@ class PageController:
                 text = await element.text_content()
                 if text:
                     texts.append(text.strip())
-            return texts
+            # An empty result may just mean the content is still loading
+            if texts and self.enable_caching:
+                self._selector_cache[(selector, None)] = texts
+            return list(texts)
         except PlaywrightError as e:
             logger.warning(f"Failed to get text from elements: {selector}, error: {e}")
             return []
@@ -448,6 +542,10 @@ class PageController:
     
     async def get_all_attributes(self, selector: str, attribute: str) -> List[str]:
         """Get attribute values from all elements matching the selector."""
+        cached = self._selector_cache.get((selector, attribute)) if self.enable_caching else None
+        if cached is not None:
+            return list(cached)
+        
         try:
             elements = await self.page.locator(selector).all()
             attributes = []
@@ -455,13 +553,55 @@ class PageController:
                 attr_value = await element.get_attribute(attribute)
                 if attr_value:
                     attributes.append(attr_value)
-            return attributes
+            if attributes and self.enable_caching:
+                self._selector_cache[(selector, attribute)] = attributes
+            return list(attributes)
         except PlaywrightError as e:
             logger.warning(f"Failed to get attributes from elements: {selector}, error: {e}")
             return []
     
+    async def get_all_text_and_attrs(
+        self,
+        selector: str,
+        attribute: str,
+        attr_selector: Optional[str] = None
+    ) -> Dict[str, List[Optional[str]]]:
+        """
+        Get text and an attribute from all matching elements in one round-trip.
+        
+        Args:
+            selector: CSS selector for the elements
+            attribute: Attribute to read
+            attr_selector: Optional descendant selector to read the attribute
+                from (e.g. "a" for links inside each element)
+        
+        Returns:
+            {"text": [...], "attrs": [...]} with one entry per element, in
+            document order; missing attributes are None
+        """
+        try:
+            return await self.page.evaluate(
+                """([sel, attr, attrSel]) => {
+                    const els = [...document.querySelectorAll(sel)];
+                    return {
+                        text: els.map(e => (e.textContent || "").trim()),
+                        attrs: els.map(e => {
+                            const target = attrSel ? e.querySelector(attrSel) : e;
+                            return target ? target.getAttribute(attr) : null;
+                        })
+                    };
+                }""",
+                [selector, attribute, attr_selector]
+            )
+        except PlaywrightError as e:
+            logger.warning(f"Failed to get text and attributes from elements: {selector}, error: {e}")
+            return {"text": [], "attrs": []}
+    
     async def get_page_info(self) -> Dict[str, Any]:
         """Get comprehensive information about the current page."""
+        return await self._cached_snapshot("page_info", (), self._read_page_info)
+    
+    async def _read_page_info(self) -> Dict[str, Any]:
         return {
             "url": self.page.url,
             "title": await self.page.title(),
@@ -474,6 +614,9 @@ class PageController:
     
     async def extract_structured_data(self) -> Dict[str, Any]:
         """Extract structured data from the page (JSON-LD, microdata, etc.)."""
+        return await self._cached_snapshot("structured_data", (), self._read_structured_data)
+    
+    async def _read_structured_data(self) -> Dict[str, Any]:
         return await self.page.evaluate("""
             () => {
                 const data = {
@@ -508,6 +651,7 @@ class PageController:
     
     async def scroll_to_element(self, selector: str) -> ActionResult:
         """Scroll to make an element visible."""
+        self._invalidate_page_caches()  # Scrolling can lazy-load content
         try:
             element = await self.find_element(selector, WaitStrategy.ATTACHED)
             if not element:
@@ -544,16 +688,54 @@ class PageController:
             await self.page.wait_for_load_state("networkidle", timeout=timeout or self.timeout)
         
         await self._wait_for_stable_dom()
+        self._invalidate_page_caches()
     
     async def take_screenshot(
         self,
         full_page: bool = False,
-        element_selector: Optional[str] = None
+        element_selector: Optional[str] = None,
+        image_type: str = "png",
+        quality: Optional[int] = None
+    ) -> bytes:
+        """
+        Take a screenshot of the page or specific element.
+        
+        Args:
+            full_page: Capture the whole scrollable page instead of the viewport
+            element_selector: Capture only this element
+            image_type: "png" or "jpeg"
+            quality: JPEG quality 0-100; ignored for PNG
+            
+        Returns:
+            Encoded image bytes
+        """
+        if image_type not in ("png", "jpeg"):
+            raise ValidationError(f"Unsupported screenshot type: {image_type}")
+        if image_type == "png":
+            quality = None
+        
+        return await self._cached_snapshot(
+            "screenshot",
+            (full_page, element_selector, image_type, quality),
+            lambda: self._capture_screenshot(full_page, element_selector, image_type, quality)
+        )
+    
+    async def _capture_screenshot(
+        self,
+        full_page: bool,
+        element_selector: Optional[str],
+        image_type: str,
+        quality: Optional[int]
     ) -> bytes:
-        """Take a screenshot of the page or specific element."""
+        cache_key = element_selector or ('full' if full_page else 'viewport')
+        if image_type != "png":
+            cache_key = f"{cache_key}:{image_type}:{quality}"
+        options = {"type": image_type}
+        if quality is not None:
+            options["quality"] = quality
+        
         # Check cache first if enabled
         if self.enable_caching and hasattr(self, '_cache_manager'):
-            cache_key = element_selector or ('full' if full_page else 'viewport')
             cached_screenshot = await self._cache_manager.get_cached_screenshot(
                 self.page.url, 
                 cache_key
@@ -566,15 +748,14 @@ class PageController:
         if element_selector:
             element = await self.find_element(element_selector)
             if element:
-                screenshot = await element.first.screenshot()
+                screenshot = await element.first.screenshot(**options)
             else:
                 raise BrowserError(f"Element not found for screenshot: {element_selector}")
         else:
-            screenshot = await self.page.screenshot(full_page=full_page)
+            screenshot = await self.page.screenshot(full_page=full_page, **options)
         
         # Cache the screenshot if enabled
         if self.enable_caching and hasattr(self, '_cache_manager'):
-            cache_key = element_selector or ('full' if full_page else 'viewport')
             await self._cache_manager.cache_screenshot(
                 self.page.url,
                 cache_key,
@@ -0,0 +1,80 @@
+"""
+Process-wide Chromium instance that several browser managers can attach to over CDP.
+"""
+
+import asyncio
+import socket
+from typing import Optional
+
+from playwright.async_api import async_playwright, Browser, Playwright
+
+from ..core.config import settings
+from ..core.logger import get_logger
+from .stealth import create_browser_args
+
+logger = get_logger(__name__)
+
+
+def _find_free_port() -> int:
+    """Reserve an ephemeral localhost port for the DevTools endpoint."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class SharedChromium:
+    """
+    Singleton Chromium launched once with remote debugging enabled.
+
+    Agents connect to ``ws`` via ``connect_over_cdp`` and only own the
+    contexts they create, so N agents share one set of browser processes.
+    """
+
+    _instance: Optional["SharedChromium"] = None
+    _lock: Optional[asyncio.Lock] = None
+
+    def __init__(self, playwright: Playwright, browser: Browser, endpoint: str):
+        self.playwright = playwright
+        self.browser = browser
+        self.ws = endpoint
+
+    @classmethod
+    async def get(cls) -> "SharedChromium":
+        """Return the shared instance, launching Chromium on first use."""
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if cls._instance and cls._instance.browser.is_connected():
+                return cls._instance
+
+            port = _find_free_port()
+            browser_config = settings.get_browser_config()
+            browser_config.pop("viewport", None)
+            browser_config["args"] = create_browser_args(stealth=True) + [
+                f"--remote-debugging-port={port}"
+            ]
+
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(**browser_config)
+
+            # Playwright does not expose the DevTools URL of a launched browser,
+            # so use the HTTP endpoint on the reserved port instead
+            cls._instance = cls(playwright, browser, f"http://127.0.0.1:{port}")
+            logger.info("Shared Chromium launched", endpoint=cls._instance.ws)
+            return cls._instance
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared browser if it was started."""
+        instance, cls._instance = cls._instance, None
+        if not instance:
+            return
+
+        try:
+            if instance.browser.is_connected():
+                await instance.browser.close()
+            await instance.playwright.stop()
+            logger.info("Shared Chromium closed")
+        except Exception as e:
+            logger.warning("Error closing shared Chromium", error=str(e))
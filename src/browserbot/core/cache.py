@@ -2,11 +2,11 @@
 Redis-based caching system for BrowserBot performance optimization.
 """
 
-import json
 import hashlib
 import base64
 from typing import Optional, Any, Dict, Union, List
 from datetime import timedelta
+import orjson
 import redis
 from redis.exceptions import RedisError
 import logging
@@ -76,8 +76,8 @@ class CacheManager:
             "args": args,
             "kwargs": kwargs
         }
-        key_str = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.sha256(key_str.encode()).hexdigest()[:16]
+        key_bytes = orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        key_hash = hashlib.sha256(key_bytes).hexdigest()[:16]
         return f"browserbot:{prefix}:{key_hash}"
     
     async def get(self, key: str) -> Optional[Any]:
@@ -98,8 +98,8 @@ class CacheManager:
                 self._cache_stats["hits"] += 1
                 # Try to deserialize as JSON first, then pickle
                 try:
-                    return json.loads(value)
-                except (json.JSONDecodeError, TypeError):
+                    return orjson.loads(value)
+                except (orjson.JSONDecodeError, TypeError):
                     try:
                         return pickle.loads(value)
                     except Exception:
@@ -121,7 +121,7 @@ class CacheManager:
         try:
             # Serialize value
             if isinstance(value, (dict, list)):
-                serialized = json.dumps(value)
+                serialized = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             elif isinstance(value, bytes):
                 serialized = value
             else:
@@ -219,16 +219,27 @@ class CacheManager:
         key = self._generate_key("dom", url)
         return await self.get(key)
     
-    async def cache_ai_response(self, prompt_hash: str, response: str, 
+    @staticmethod
+    def _ai_response_key(model: str, prompt_hash: str) -> str:
+        # prompt_hash is already a digest, so it's used as-is; keeping the
+        # model readable lets one model's responses be cleared by pattern
+        return f"browserbot:ai_response:{model}:{prompt_hash}"
+    
+    async def cache_ai_response(self, prompt_hash: str, response: Union[str, bytes], 
                                model: str, ttl: int = 7200) -> bool:
-        """Cache AI model response."""
-        key = self._generate_key("ai_response", model, prompt_hash)
-        return await self.set(key, response, ttl)
+        """Cache AI model response; JSON bytes are stored as-is."""
+        return await self.set(self._ai_response_key(model, prompt_hash), response, ttl)
     
-    async def get_cached_ai_response(self, prompt_hash: str, model: str) -> Optional[str]:
-        """Get cached AI response."""
-        key = self._generate_key("ai_response", model, prompt_hash)
-        return await self.get(key)
+    async def get_cached_ai_response(self, prompt_hash: str, model: str) -> Optional[Any]:
+        """Get cached AI response, already decoded if it was stored as JSON bytes."""
+        return await self.get(self._ai_response_key(model, prompt_hash))
+    
+    async def clear_ai_responses(self, model: Optional[str] = None) -> int:
+        """Clear cached AI responses for one model, or for every model."""
+        if model is None:
+            return await self.clear_pattern("browserbot:ai_response:*")
+        escaped = "".join(f"\\{c}" if c in "*?[]\\" else c for c in model)
+        return await self.clear_pattern(f"browserbot:ai_response:{escaped}:*")
     
     async def cache_extraction_result(self, url: str, extraction_prompt: str, 
                                     result: Any, ttl: int = 3600) -> bool:
@@ -0,0 +1,59 @@
+"""
+Concurrency helpers for running many browser tasks without unbounded fan-out.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Dict, List, Tuple
+
+# name -> (loop, semaphore); semaphores can't be shared across event loops
+_shared_semaphores: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+async def gather_bounded(*coros: Awaitable[Any], limit: int) -> List[Any]:
+    """
+    Like ``asyncio.gather(..., return_exceptions=True)`` but with at most
+    ``limit`` awaitables in flight at once.
+
+    Args:
+        *coros: Awaitables to run
+        limit: Maximum number of awaitables running concurrently
+
+    Returns:
+        Results (or raised exceptions) in the same order as ``coros``
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _guarded(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_guarded(c) for c in coros), return_exceptions=True)
+
+
+def get_shared_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """
+    Get a process-wide semaphore for the running event loop.
+
+    Every caller using the same name shares one limit, e.g. all agents in a
+    server process sharing a provider's rate limit. The limit is fixed when
+    the semaphore is first created on a loop.
+
+    Args:
+        name: Identifier of the shared resource
+        limit: Maximum concurrent holders
+
+    Returns:
+        Semaphore bound to the running loop
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    loop = asyncio.get_running_loop()
+    entry = _shared_semaphores.get(name)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(limit))
+        _shared_semaphores[name] = entry
+    return entry[1]
@@ -145,6 +145,16 @@ class Settings(BaseSettings):
         default=True,
         description="Reduce delays for faster execution"
     )
+    max_parallel_tools: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum read-only tool calls from one model response run concurrently"
+    )
+    max_llm_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum model requests in flight across all agents in the process"
+    )
     
     # Monitoring Configuration
     enable_metrics: bool = Field(
@@ -105,7 +105,7 @@ class DeadLetterQueue:
         # Start background cleanup task
         asyncio.create_task(self._cleanup_task())
     
-    async def add_message(
+    def _build_message(
         self,
         operation: str,
         payload: Dict[str, Any],
@@ -113,16 +113,14 @@ class DeadLetterQueue:
         max_retries: int = 3,
         expires_in: Optional[timedelta] = None,
         metadata: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """Add a failed operation to the DLQ."""
-        message_id = str(uuid.uuid4())
-        
+    ) -> DLQMessage:
+        """Create and register a DLQ message without persisting it."""
         expires_at = None
         if expires_in:
             expires_at = datetime.utcnow() + expires_in
         
         message = DLQMessage(
-            id=message_id,
+            id=str(uuid.uuid4()),
             operation=operation,
             payload=payload,
             error=str(error),
@@ -134,7 +132,22 @@ class DeadLetterQueue:
             metadata=metadata or {}
         )
         
-        self.messages[message_id] = message
+        self.messages[message.id] = message
+        return message
+    
+    async def add_message(
+        self,
+        operation: str,
+        payload: Dict[str, Any],
+        error: Exception,
+        max_retries: int = 3,
+        expires_in: Optional[timedelta] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Add a failed operation to the DLQ."""
+        message = self._build_message(
+            operation, payload, error, max_retries, expires_in, metadata
+        )
         
         # Persist to disk
         if self.enable_persistence:
@@ -142,12 +155,36 @@ class DeadLetterQueue:
         
         logger.info(
             "Message added to DLQ",
-            message_id=message_id,
+            message_id=message.id,
             operation=operation,
-            error_type=type(error).__name__
+            error_type=message.error_type
+        )
+        
+        return message.id
+    
+    async def add_batch(self, messages: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several failed operations to the DLQ in one call.
+        
+        Args:
+            messages: Dicts of add_message keyword arguments
+            
+        Returns:
+            IDs of the added messages, in input order
+        """
+        built = [self._build_message(**message) for message in messages]
+        
+        # Persist the whole batch concurrently instead of one write per await
+        if self.enable_persistence and built:
+            await asyncio.gather(*(self._save_message(message) for message in built))
+        
+        logger.info(
+            "Message batch added to DLQ",
+            count=len(built),
+            operations=sorted({message.operation for message in built})
         )
         
-        return message_id
+        return [message.id for message in built]
     
     async def get_message(self, message_id: str) -> Optional[DLQMessage]:
         """Get message by ID."""
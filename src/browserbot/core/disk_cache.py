@@ -0,0 +1,119 @@
+"""
+SQLite-backed key/value cache that persists across processes.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = ".browserbot_llm_cache.sqlite"
+
+
+class DiskCache:
+    """
+    String cache stored in a SQLite file with per-entry expiry.
+
+    Every process that opens the same file shares its entries, so repeated
+    runs (CI jobs, local test scripts) can reuse results without Redis.
+    Queries run in a worker thread to keep the event loop free.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            # WAL lets readers in other processes proceed while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            return value
+
+    def _set(self, key: str, value: str, ttl: Optional[float]) -> None:
+        expires_at = None if ttl is None else time.time() + ttl
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            )
+            conn.commit()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Get a fresh value for key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None if missing, expired or the database failed
+        """
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except sqlite3.Error as e:
+            logger.warning("Disk cache read failed", path=self.path, error=str(e))
+            return None
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> bool:
+        """
+        Store value for key, replacing any previous entry.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires; None keeps it forever
+
+        Returns:
+            True if the value was written
+        """
+        try:
+            await asyncio.to_thread(self._set, key, value, ttl)
+            return True
+        except sqlite3.Error as e:
+            logger.warning("Disk cache write failed", path=self.path, error=str(e))
+            return False
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -376,7 +376,7 @@ class ErrorHandler:
         
         # Add specific information for certain errors
         additional_info = {}
-        if isinstance(error, RateLimitError) and hasattr(error, 'retry_after'):
+        if isinstance(error, RateLimitError):
             additional_info["retry_after"] = error.retry_after
         
         return UserErrorResponse(
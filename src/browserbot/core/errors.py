@@ -151,6 +151,8 @@ class ConfigurationError(BrowserBotError):
 class RateLimitError(NetworkError):
     """Rate limit errors from APIs."""
     
+    retry_after: int = 60  # Seconds to wait when the provider doesn't say
+    
     def __init__(
         self, 
         message: str, 
@@ -159,9 +161,22 @@ class RateLimitError(NetworkError):
     ):
         super().__init__(message, **kwargs)
         if retry_after:
+            self.retry_after = retry_after
             self.context.metadata = {"retry_after": retry_after}
 
 
+class CircuitBreakerOpenError(BrowserBotError):
+    """Call rejected because its circuit breaker is open."""
+    
+    def __init__(self, message: str = "Circuit breaker is OPEN", **kwargs):
+        context = ErrorContext(
+            severity=ErrorSeverity.MEDIUM,
+            category=ErrorCategory.SYSTEM,
+            max_retries=0  # Retrying immediately defeats the breaker
+        )
+        super().__init__(message, context, **kwargs)
+
+
 class TimeoutError(BrowserError):
     """Timeout errors from browser operations."""
     
@@ -6,9 +6,15 @@ from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 from ..core.cache import get_cache_client
 from ..core.logger import setup_logger
+from ..core.ttl_cache import TTLCache
 
 logger = setup_logger(__name__)
 
+# Resolved (flag, user_id) -> enabled, so creating an agent doesn't hit
+# Redis for every flag check; changes made elsewhere show up within the TTL
+FLAG_CACHE_TTL = 60
+_flag_cache = TTLCache(maxsize=1024, ttl=FLAG_CACHE_TTL)
+
 class FeatureFlags:
     """Feature flag management with Redis backend and fallback defaults."""
     
@@ -68,6 +74,26 @@ class FeatureFlags:
                 "enabled": True,
                 "description": "Adapt delays based on site behavior and load times",
                 "rollout_percentage": 100
+            },
+            "semantic_cache": {
+                "enabled": False,
+                "description": "Reuse AI responses for similarly worded tasks (needs sentence-transformers)",
+                "rollout_percentage": 0
+            },
+            "persistent_llm_cache": {
+                "enabled": False,
+                "description": "Keep AI responses in a local SQLite file shared across runs",
+                "rollout_percentage": 0
+            },
+            "streaming_tool_dispatch": {
+                "enabled": False,
+                "description": "Start Mistral tool calls while the response is still streaming (bypasses the AI cache)",
+                "rollout_percentage": 0
+            },
+            "speculative_reads": {
+                "enabled": False,
+                "description": "Read page info and a screenshot while the model decides, for the next tool call to reuse",
+                "rollout_percentage": 0
             }
         }
         
@@ -185,6 +211,7 @@ class FeatureFlags:
             
             # Save to cache
             self.cache.set(key, flag_data, ttl=None)
+            clear_flag_cache()
             logger.info(f"Updated feature flag {flag_name}: enabled={enabled}")
             
             return True
@@ -197,6 +224,7 @@ class FeatureFlags:
         try:
             key = f"{self.prefix}{flag_name}"
             self.cache.client.delete(key)
+            clear_flag_cache()
             logger.info(f"Deleted feature flag: {flag_name}")
             return True
         except Exception as e:
@@ -267,5 +295,18 @@ def get_feature_flags() -> FeatureFlags:
     return _feature_flags
 
 def is_feature_enabled(flag_name: str, user_id: Optional[str] = None) -> bool:
-    """Convenience function to check if a feature is enabled."""
-    return get_feature_flags().is_enabled(flag_name, user_id)
\ No newline at end of file
+    """
+    Convenience function to check if a feature is enabled.
+    
+    Results are memoized per (flag, user) for FLAG_CACHE_TTL seconds.
+    """
+    key = (flag_name, user_id)
+    enabled = _flag_cache.get(key)
+    if enabled is None:
+        enabled = get_feature_flags().is_enabled(flag_name, user_id)
+        _flag_cache.put(key, enabled)
+    return enabled
+
+def clear_flag_cache() -> None:
+    """Forget memoized flag results, e.g. after flags change in Redis."""
+    _flag_cache.clear()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Shared pooled HTTP client for model API calls.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client, creating it on first use.
+
+    Every LLM created through BrowserAgent shares this client, so repeated
+    model calls reuse kept-alive connections instead of paying a TCP and TLS
+    handshake each time. Connections belong to an event loop, so a new client
+    is created if called from a different loop than the current one.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client, _client_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _client is None or _client.is_closed or (loop is not None and _client_loop not in (None, loop)):
+        http2 = _http2_available()
+        _client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        )
+        _client_loop = loop
+        logger.debug("Created shared HTTP client", http2=http2)
+
+    return _client
+
+
+async def warm_http_client(url: str, timeout: float = 2.0) -> None:
+    """
+    Open a kept-alive connection to url before the first real request needs it.
+
+    Failures are only logged; the real request will simply connect itself.
+
+    Args:
+        url: Any URL on the host to connect to
+        timeout: Seconds to wait for the warm-up request
+    """
+    try:
+        await get_http_client().head(url, timeout=timeout)
+    except Exception as e:
+        # Includes httpx.InvalidURL, which isn't an HTTPError
+        logger.debug("HTTP client warm-up failed", url=url, error=str(e))
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
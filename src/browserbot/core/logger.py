@@ -2,8 +2,11 @@
 Structured logging configuration for BrowserBot.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any, Dict, Optional
 import structlog
@@ -84,6 +87,33 @@ def setup_logging(
         root_logger.addHandler(file_handler)
 
 
+_queue_listener: Optional[QueueListener] = None
+
+
+def enable_queued_logging() -> None:
+    """
+    Move the root logger's handlers onto a background thread.
+    
+    Log calls then only enqueue the record, so concurrent coroutines don't
+    block on stderr or file writes. Calling it again has no effect.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+    
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    # Flush whatever is still queued on interpreter exit
+    atexit.register(_queue_listener.stop)
+
+
 def get_logger(name: str, **kwargs: Any) -> structlog.BoundLogger:
     """
     Get a configured logger instance.
@@ -31,7 +31,7 @@ except ImportError:
         return func
 
 from .logger import get_logger
-from .errors import BrowserBotError, NetworkError, RateLimitError
+from .errors import BrowserBotError, CircuitBreakerOpenError, NetworkError, RateLimitError
 
 logger = get_logger(__name__)
 
@@ -84,62 +84,65 @@ class CircuitBreaker:
         self.config = config
         self.state = CircuitBreakerState()
     
-    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
-        """Execute function with circuit breaker protection."""
+    def is_open(self) -> bool:
+        """Check whether calls should currently be rejected without trying."""
+        return (
+            self.state.state == CircuitState.OPEN
+            and not self.state.should_attempt_reset(self.config.recovery_timeout)
+        )
+    
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        if self.state.state == CircuitState.HALF_OPEN:
+            logger.info("Circuit breaker reset successful", state="closed")
+        self.state.record_success()
+    
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        self.state.record_failure()
+        
+        if self.state.failure_count >= self.config.failure_threshold:
+            if self.state.state != CircuitState.OPEN:
+                logger.warning(
+                    "Circuit breaker opened",
+                    failure_count=self.state.failure_count,
+                    threshold=self.config.failure_threshold
+                )
+            self.state.state = CircuitState.OPEN
+    
+    def _before_call(self) -> None:
+        """Reject the call if open, or move to half-open once recovery is due."""
         if self.state.state == CircuitState.OPEN:
             if self.state.should_attempt_reset(self.config.recovery_timeout):
                 logger.info("Circuit breaker attempting reset", state="half_open")
                 self.state.state = CircuitState.HALF_OPEN
             else:
-                raise Exception("Circuit breaker is OPEN")
+                raise CircuitBreakerOpenError()
+    
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Execute function with circuit breaker protection."""
+        self._before_call()
         
         try:
             result = func(*args, **kwargs)
-            if self.state.state == CircuitState.HALF_OPEN:
-                logger.info("Circuit breaker reset successful", state="closed")
-            self.state.record_success()
+            self.record_success()
             return result
             
         except self.config.expected_exception as e:
-            self.state.record_failure()
-            
-            if self.state.failure_count >= self.config.failure_threshold:
-                logger.warning(
-                    "Circuit breaker opened",
-                    failure_count=self.state.failure_count,
-                    threshold=self.config.failure_threshold
-                )
-                self.state.state = CircuitState.OPEN
-            
+            self.record_failure()
             raise e
     
     async def async_call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """Execute async function with circuit breaker protection."""
-        if self.state.state == CircuitState.OPEN:
-            if self.state.should_attempt_reset(self.config.recovery_timeout):
-                logger.info("Circuit breaker attempting reset", state="half_open")
-                self.state.state = CircuitState.HALF_OPEN
-            else:
-                raise Exception("Circuit breaker is OPEN")
+        self._before_call()
         
         try:
             result = await func(*args, **kwargs)
-            if self.state.state == CircuitState.HALF_OPEN:
-                logger.info("Circuit breaker reset successful", state="closed")
-            self.state.record_success()
+            self.record_success()
             return result
             
         except self.config.expected_exception as e:
-            self.state.record_failure()
-            
-            if self.state.failure_count >= self.config.failure_threshold:
-                logger.warning(
-                    "Circuit breaker opened",
-                    failure_count=self.state.failure_count,
-                    threshold=self.config.failure_threshold
-                )
-                self.state.state = CircuitState.OPEN
-            
+            self.record_failure()
             raise e
 
 
@@ -265,22 +268,39 @@ def with_circuit_breaker(
 
 
 class RetryableOperation:
-    """Context manager for retryable operations with manual control."""
+    """
+    Context manager for retryable operations with manual control.
+    
+    Besides driving should_retry()/wait_before_retry() by hand, the operation
+    can own the loop: ``async for attempt in op`` yields attempt numbers
+    (starting at 1), and a ``with op:`` block inside the loop records a
+    failure so the next iteration happens after a backoff delay.
+    """
     
     def __init__(
         self,
         max_attempts: int = 3,
         base_delay: float = 1.0,
-        exceptions: tuple[type[Exception], ...] = (Exception,)
+        exceptions: tuple[type[Exception], ...] = (Exception,),
+        backoff: str = "exponential",
+        cap_delay: float = 512.0,
+        jitter: tuple[float, float] = (0.5, 1.5)
     ):
+        if backoff not in ("exponential", "constant"):
+            raise ValueError(f"Unknown backoff strategy: {backoff}")
+        
         self.max_attempts = max_attempts
         self.base_delay = base_delay
         self.exceptions = exceptions
+        self.backoff = backoff
+        self.cap_delay = cap_delay
+        self.jitter = jitter
         self.attempt = 0
         self.last_exception: Optional[Exception] = None
     
     def __enter__(self):
-        self.attempt = 0
+        # Do not reset the attempt counter so the block can be used per attempt
+        self.last_exception = None
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -299,15 +319,39 @@ class RetryableOperation:
             return True  # Suppress exception
         return False
     
+    async def __aiter__(self):
+        """Yield attempt numbers until an attempt succeeds or attempts run out."""
+        self.attempt = 0
+        self.last_exception = None
+        
+        while True:
+            yield self.attempt + 1
+            
+            if self.last_exception is None:
+                return
+            
+            if self.attempt + 1 >= self.max_attempts:
+                raise self.last_exception
+            
+            await self.wait_before_retry()
+    
     def should_retry(self) -> bool:
         """Check if operation should be retried."""
         return self.attempt < self.max_attempts and self.last_exception is not None
     
+    def next_delay(self) -> float:
+        """Delay before the next retry, with multiplicative jitter."""
+        if self.backoff == "exponential":
+            delay = min(self.cap_delay, self.base_delay * (2 ** self.attempt))
+        else:
+            delay = min(self.cap_delay, self.base_delay)
+        return delay * random.uniform(*self.jitter)
+    
     async def wait_before_retry(self) -> None:
         """Wait before next retry with exponential backoff."""
         if self.should_retry():
-            delay = calculate_backoff_with_jitter(self.attempt, self.base_delay)
+            delay = self.next_delay()
             logger.info(f"Waiting {delay:.2f}s before retry {self.attempt + 1}")
             await asyncio.sleep(delay)
             self.attempt += 1
-            self.last_exception = None
\ No newline at end of file
+            self.last_exception = None
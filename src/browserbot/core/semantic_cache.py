@@ -0,0 +1,137 @@
+"""
+In-process semantic cache that matches prompts by embedding similarity.
+"""
+
+import asyncio
+import math
+import operator
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    """Scale a vector to unit length so a dot product is cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return [0.0 for _ in vector]
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """
+    Cache whose lookups hit when a stored prompt is similar enough to the query.
+
+    Entries are grouped by namespace (e.g. model + system prompt) so only
+    prompts made under identical conditions are compared. Embeddings come from
+    ``encoder`` if given, otherwise from a sentence-transformers model loaded
+    on first use; without that optional dependency the cache disables itself.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        maxsize: int = 128,
+        encoder: Optional[Callable[[str], Sequence[float]]] = None,
+        model_name: str = DEFAULT_EMBEDDING_MODEL
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.model_name = model_name
+        self.enabled = True
+        self._encoder = encoder
+        self._entries: "OrderedDict[Hashable, List[Tuple[List[float], Any]]]" = OrderedDict()
+        self._size = 0
+
+    def _get_encoder(self) -> Optional[Callable[[str], Sequence[float]]]:
+        """Return the embedding function, loading the default model if needed."""
+        if self._encoder is None and self.enabled:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                logger.warning("sentence-transformers not available, semantic cache disabled")
+                self.enabled = False
+                return None
+
+            model = SentenceTransformer(self.model_name)
+            self._encoder = lambda text: model.encode(text).tolist()
+            logger.info("Semantic cache embedding model loaded", model=self.model_name)
+
+        return self._encoder
+
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed text off the event loop."""
+        encoder = self._get_encoder()
+        if encoder is None:
+            return None
+        return _normalize(await asyncio.to_thread(encoder, text))
+
+    async def lookup(self, namespace: Hashable, text: str) -> Optional[Any]:
+        """
+        Find the value stored for the most similar prompt in a namespace.
+
+        Args:
+            namespace: Group of prompts to compare against
+            text: Prompt to look up
+
+        Returns:
+            Stored value if its prompt's similarity reaches the threshold, else None
+        """
+        entries = self._entries.get(namespace)
+        if not entries or not self.enabled:
+            return None
+
+        query = await self._embed(text)
+        if query is None:
+            return None
+
+        best_score, best_value = -1.0, None
+        for vector, value in entries:
+            score = sum(map(operator.mul, vector, query))
+            if score > best_score:
+                best_score, best_value = score, value
+
+        if best_score < self.threshold:
+            return None
+
+        self._entries.move_to_end(namespace)
+        logger.debug("Semantic cache hit", similarity=round(best_score, 3))
+        return best_value
+
+    async def store(self, namespace: Hashable, text: str, value: Any) -> None:
+        """Store value under the embedding of text, evicting the oldest entries if full."""
+        if not self.enabled:
+            return
+
+        vector = await self._embed(text)
+        if vector is None:
+            return
+
+        self._entries.setdefault(namespace, []).append((vector, value))
+        self._entries.move_to_end(namespace)
+        self._size += 1
+
+        while self._size > self.maxsize:
+            oldest_namespace, oldest_entries = next(iter(self._entries.items()))
+            oldest_entries.pop(0)
+            self._size -= 1
+            if not oldest_entries:
+                del self._entries[oldest_namespace]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,79 @@
+"""
+Bounded in-process LRU cache with per-entry expiry.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire ``ttl`` seconds after being stored.
+
+    Expired entries are moved to a bounded side map so callers can still
+    fall back to the last known value via ``get_stale()``, e.g. when a
+    refresh fails.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._stale: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._remember_stale(key, value)
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value for key, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        self._stale.pop(key, None)
+
+        while len(self._data) > self.maxsize:
+            old_key, (_, old_value) = self._data.popitem(last=False)
+            self._remember_stale(old_key, old_value)
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the last stored value for key, whether fresh or expired."""
+        entry = self._data.get(key)
+        if entry is not None:
+            return entry[1]
+        return self._stale.get(key, default)
+
+    def _remember_stale(self, key: Hashable, value: Any) -> None:
+        """Keep an expired or evicted value for error-path fallback."""
+        self._stale[key] = value
+        self._stale.move_to_end(key)
+        while len(self._stale) > self.maxsize:
+            self._stale.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all fresh and stale entries."""
+        self._data.clear()
+        self._stale.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
@@ -169,6 +169,10 @@ async def stream_task(task: str, enable_caching: bool = True):
                 print(f"🚀 Starting task: {update['task']}")
             elif update["type"] == "status":
                 print(f"ℹ️  {update['message']}")
+            elif update["type"] == "token":
+                print(update["delta"], end="", flush=True)
+            elif update["type"] == "action":
+                print(f"\n🔧 Running {update['tool']}...")
             elif update["type"] == "step":
                 print(f"🔄 Step {update['step']}: {update['action']}")
             elif update["type"] == "result":
@@ -1,35 +1,69 @@
 """
 BrowserBot monitoring and observability components.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package doesn't pull in the OpenTelemetry SDK or the metrics server
+until one of their names is actually used.
 """
 
-from .metrics_server import MetricsServer, task_counter, task_duration, active_browsers
-from .observability import (
-    observability,
-    performance_monitor,
-    health_checker,
-    trace_operation,
-    measure_time,
-    ObservabilityManager,
-    PerformanceMonitor,
-    HealthChecker
-)
+import importlib
+import sys
+import types
+from typing import Any
 
 __version__ = "0.1.0"
 
-__all__ = [
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
     # Metrics server
-    "MetricsServer",
-    "task_counter",
-    "task_duration",
-    "active_browsers",
-    
+    "MetricsServer": "metrics_server",
+    "task_counter": "metrics_server",
+    "task_duration": "metrics_server",
+    "active_browsers": "metrics_server",
+
     # Observability
-    "observability",
-    "performance_monitor",
-    "health_checker",
-    "trace_operation",
-    "measure_time",
-    "ObservabilityManager",
-    "PerformanceMonitor",
-    "HealthChecker"
-]
\ No newline at end of file
+    "observability": "observability",
+    "performance_monitor": "observability",
+    "health_checker": "observability",
+    "trace_operation": "observability",
+    "measure_time": "observability",
+    "ObservabilityManager": "observability",
+    "PerformanceMonitor": "observability",
+    "HealthChecker": "observability",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache its exports."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    # Bind every export of the submodule at once
+    for attr, source in _LAZY_ATTRS.items():
+        if source == module_name:
+            globals()[attr] = getattr(module, attr)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _MonitoringPackage(types.ModuleType):
+    """Package module that keeps "observability" naming the manager instance."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Once a submodule finishes loading, the import system binds it on
+        # the package under its own name. For "observability" that would
+        # shadow the ObservabilityManager instance exported under the same
+        # name, whether the submodule was imported lazily or directly.
+        if name == "observability" and isinstance(value, types.ModuleType):
+            value = value.observability
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _MonitoringPackage
@@ -4,10 +4,11 @@ Implements distributed tracing, metrics, and structured logging.
 """
 
 import asyncio
+import os
 import time
 from typing import Optional, Dict, Any, Callable, TypeVar
 from datetime import datetime
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 from functools import wraps
 import uuid
 
@@ -30,6 +31,19 @@ T = TypeVar("T")
 trace.set_tracer_provider(TracerProvider())
 tracer = trace.get_tracer(__name__)
 
+_tracing_disabled_cache: Optional[bool] = None
+
+
+def _tracing_disabled() -> bool:
+    """Whether span creation is switched off (read once per process)."""
+    global _tracing_disabled_cache
+    if _tracing_disabled_cache is None:
+        _tracing_disabled_cache = (
+            os.getenv("OTEL_SDK_DISABLED", "").strip().lower() in ("1", "true")
+            or not settings.enable_tracing
+        )
+    return _tracing_disabled_cache
+
 # Metrics
 operation_counter = Counter(
     'browserbot_operations_total',
@@ -111,7 +125,12 @@ class ObservabilityManager:
                 # Operation code here
                 pass
         """
-        with self.tracer.start_as_current_span(operation_name) as span:
+        span_context = (
+            nullcontext(trace.INVALID_SPAN) if _tracing_disabled()
+            else self.tracer.start_as_current_span(operation_name)
+        )
+        
+        with span_context as span:
             # Add attributes
             if attributes:
                 for key, value in attributes.items():
@@ -194,7 +213,12 @@ class ObservabilityManager:
                         attributes["args"] = str(args)[:200]
                         attributes["kwargs"] = str(kwargs)[:200]
                     
-                    with self.tracer.start_as_current_span(name) as span:
+                    span_context = (
+                        nullcontext(trace.INVALID_SPAN) if _tracing_disabled()
+                        else self.tracer.start_as_current_span(name)
+                    )
+                    
+                    with span_context as span:
                         if attributes:
                             for key, value in attributes.items():
                                 span.set_attribute(key, value)
@@ -365,36 +389,37 @@ class HealthChecker:
         """Register a health check."""
         self.checks[name] = check_func
     
+    async def _run_check(self, name: str, check_func: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run a single health check, converting failures into an unhealthy result."""
+        try:
+            if asyncio.iscoroutinefunction(check_func):
+                result = await check_func()
+            else:
+                result = check_func()
+            
+            return {
+                "healthy": result.get("healthy", True),
+                "message": result.get("message", "OK"),
+                "metadata": result.get("metadata", {}),
+                "timestamp": datetime.utcnow().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Health check failed: {name}", error=str(e))
+            return {
+                "healthy": False,
+                "message": f"Check failed: {str(e)}",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+    
     async def run_checks(self) -> Dict[str, Any]:
-        """Run all health checks."""
-        results = {}
-        overall_healthy = True
-        
-        for name, check_func in self.checks.items():
-            try:
-                if asyncio.iscoroutinefunction(check_func):
-                    result = await check_func()
-                else:
-                    result = check_func()
-                
-                results[name] = {
-                    "healthy": result.get("healthy", True),
-                    "message": result.get("message", "OK"),
-                    "metadata": result.get("metadata", {}),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-                if not results[name]["healthy"]:
-                    overall_healthy = False
-                    
-            except Exception as e:
-                logger.error(f"Health check failed: {name}", error=str(e))
-                results[name] = {
-                    "healthy": False,
-                    "message": f"Check failed: {str(e)}",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                overall_healthy = False
+        """Run all health checks concurrently."""
+        names = list(self.checks)
+        outcomes = await asyncio.gather(
+            *(self._run_check(name, self.checks[name]) for name in names)
+        )
+        results = dict(zip(names, outcomes))
+        overall_healthy = all(result["healthy"] for result in outcomes)
         
         self.last_check_results = results
         
@@ -420,7 +445,14 @@ health_checker = HealthChecker()
 
 # Convenience decorators
 def trace_operation(operation_name: Optional[str] = None, capture_args: bool = False):
-    """Convenience decorator for tracing operations."""
+    """
+    Convenience decorator for tracing operations.
+    
+    With tracing and metrics both disabled the function is returned unwrapped,
+    so decorated calls cost nothing extra.
+    """
+    if _tracing_disabled() and not settings.enable_metrics:
+        return lambda func: func
     return observability.trace_function(operation_name, capture_args)
 
 
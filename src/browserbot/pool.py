@@ -0,0 +1,171 @@
+"""
+Pool of pre-warmed browser agents shared across tasks.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from .agents.browser_agent import BrowserAgent
+from .browser.shared_chromium import SharedChromium
+from .core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BrowserAgentPool:
+    """
+    Reuses a fixed number of BrowserAgent instances so Chromium start-up is
+    paid once per agent instead of once per task.
+
+    Agents are handed out through ``acquire()`` and recycled (closed and
+    replaced) after ``max_uses`` acquisitions. With ``shared_browser`` every
+    agent attaches to one SharedChromium over CDP instead of launching its own.
+    """
+
+    def __init__(
+        self,
+        size: int = 3,
+        max_uses: int = 50,
+        shared_browser: bool = False,
+        **agent_kwargs: Any
+    ):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.size = size
+        self.max_uses = max_uses
+        self.shared_browser = shared_browser
+        self.agent_kwargs = agent_kwargs
+
+        self._queue: "asyncio.Queue[Tuple[BrowserAgent, int]]" = asyncio.Queue()
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._closed_event: Optional[asyncio.Event] = None
+        self._started = False
+        self._closed = False
+
+    async def _spawn(self) -> BrowserAgent:
+        """Create an agent and launch its browser ahead of first use."""
+        agent = BrowserAgent(**self.agent_kwargs)
+        await agent.browser_manager.initialize()
+        return agent
+
+    async def start(self) -> None:
+        """Warm up all agents concurrently."""
+        if self._started:
+            return
+
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self._started:
+                return
+
+            if self.shared_browser:
+                shared = await SharedChromium.get()
+                self.agent_kwargs["cdp_endpoint"] = shared.ws
+
+            agents = await asyncio.gather(*(self._spawn() for _ in range(self.size)))
+            for agent in agents:
+                self._queue.put_nowait((agent, 0))
+
+            self._started = True
+            logger.info("Browser agent pool started", size=self.size, max_uses=self.max_uses)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[BrowserAgent]:
+        """Borrow an agent from the pool for the duration of the block."""
+        if self._closed:
+            raise RuntimeError("BrowserAgentPool is closed")
+
+        await self.start()
+        agent, uses = await self._get()
+
+        try:
+            yield agent
+        finally:
+            uses += 1
+            if self._closed:
+                # close() only reached idle agents; this one was borrowed
+                await agent.close()
+            elif uses >= self.max_uses:
+                await self._recycle(agent, uses)
+            else:
+                self._queue.put_nowait((agent, uses))
+
+    async def _get(self) -> Tuple[BrowserAgent, int]:
+        """Wait for an idle agent, giving up if the pool closes first."""
+        if self._closed_event is None:
+            self._closed_event = asyncio.Event()
+        if self._closed:
+            raise RuntimeError("BrowserAgentPool is closed")
+
+        getter = asyncio.ensure_future(self._queue.get())
+        closed = asyncio.ensure_future(self._closed_event.wait())
+        try:
+            await asyncio.wait((getter, closed), return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            # Don't lose an agent the getter took just before cancellation
+            if getter.done() and not getter.cancelled():
+                self._queue.put_nowait(getter.result())
+            raise
+        finally:
+            closed.cancel()
+            getter.cancel()
+
+        if getter.done() and not getter.cancelled():
+            agent, uses = getter.result()
+            if self._closed:
+                # close() drained the queue before this agent came back to it
+                await agent.close()
+                raise RuntimeError("BrowserAgentPool is closed")
+            return agent, uses
+
+        raise RuntimeError("BrowserAgentPool is closed")
+
+    async def _recycle(self, agent: BrowserAgent, uses: int) -> None:
+        """Replace a worn-out agent, keeping it in service if no replacement launches."""
+        logger.debug("Recycling browser agent", session_id=agent.session_id, uses=uses)
+        try:
+            replacement = await self._spawn()
+        except Exception as e:
+            # Losing the slot would leave acquire() waiting forever once
+            # every slot is gone; try again after its next use instead
+            logger.warning(
+                "Failed to launch replacement browser agent",
+                session_id=agent.session_id,
+                error=str(e)
+            )
+            self._queue.put_nowait((agent, uses))
+            return
+
+        await agent.close()
+        if self._closed:
+            await replacement.close()
+        else:
+            self._queue.put_nowait((replacement, 0))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "size": self.size,
+            "available": self._queue.qsize(),
+            "max_uses": self.max_uses,
+            "shared_browser": self.shared_browser,
+            "started": self._started,
+        }
+
+    async def close(self) -> None:
+        """Close every idle agent in the pool; borrowed agents are closed when returned."""
+        self._closed = True
+        if self._closed_event is not None:
+            # Wake acquire() calls still waiting for an agent
+            self._closed_event.set()
+
+        while not self._queue.empty():
+            agent, _ = self._queue.get_nowait()
+            await agent.close()
+
+        self._started = False
+        logger.info("Browser agent pool closed")
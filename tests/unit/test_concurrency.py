@@ -0,0 +1,74 @@
+"""
+Unit tests for concurrency helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from src.browserbot.core.concurrency import gather_bounded, get_shared_semaphore
+
+
+@pytest.mark.unit
+class TestGatherBounded:
+    """Test gather_bounded functionality."""
+
+    async def test_preserves_order_and_exceptions(self):
+        """Test results keep input order and exceptions are returned."""
+        async def ok(value):
+            await asyncio.sleep(0.01 * (3 - value))
+            return value
+
+        async def fail():
+            raise ValueError("boom")
+
+        results = await gather_bounded(ok(0), fail(), ok(2), limit=2)
+
+        assert results[0] == 0
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 2
+
+    async def test_limits_in_flight(self):
+        """Test no more than limit awaitables run at once."""
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await gather_bounded(*(work() for _ in range(10)), limit=3)
+
+        assert peak == 3
+
+    async def test_invalid_limit(self):
+        """Test a non-positive limit is rejected."""
+        with pytest.raises(ValueError):
+            await gather_bounded(limit=0)
+
+
+@pytest.mark.unit
+class TestSharedSemaphore:
+    """Test get_shared_semaphore functionality."""
+
+    async def test_same_name_shares_semaphore(self):
+        """Test callers on one loop get the same semaphore per name."""
+        first = get_shared_semaphore("test-shared", 2)
+
+        assert get_shared_semaphore("test-shared", 2) is first
+        assert get_shared_semaphore("test-other", 2) is not first
+
+    def test_new_semaphore_per_loop(self):
+        """Test a semaphore is never reused on another event loop."""
+        async def fetch():
+            return get_shared_semaphore("test-loop", 1)
+
+        assert asyncio.run(fetch()) is not asyncio.run(fetch())
+
+    async def test_rejects_invalid_limit(self):
+        """Test a limit below one is rejected."""
+        with pytest.raises(ValueError):
+            get_shared_semaphore("test-invalid", 0)
@@ -0,0 +1,57 @@
+"""
+Unit tests for the SQLite disk cache.
+"""
+
+import pytest
+
+from src.browserbot.core import disk_cache
+from src.browserbot.core.disk_cache import DiskCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache.sqlite")
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    """Test DiskCache functionality."""
+
+    async def test_get_and_set(self, cache_path):
+        """Test basic storage and lookup."""
+        cache = DiskCache(cache_path)
+        assert await cache.set("a", "1")
+
+        assert await cache.get("a") == "1"
+        assert await cache.get("missing") is None
+        cache.close()
+
+    async def test_shared_between_instances(self, cache_path):
+        """Test a second cache on the same file sees stored entries."""
+        writer = DiskCache(cache_path)
+        await writer.set("a", "1")
+        writer.close()
+
+        reader = DiskCache(cache_path)
+        assert await reader.get("a") == "1"
+        reader.close()
+
+    async def test_entries_expire(self, cache_path, monkeypatch):
+        """Test entries are dropped once their TTL passes."""
+        now = [1000.0]
+        monkeypatch.setattr(disk_cache.time, "time", lambda: now[0])
+        cache = DiskCache(cache_path)
+        await cache.set("a", "1", ttl=10)
+
+        now[0] += 11
+        assert await cache.get("a") is None
+        cache.close()
+
+    async def test_clear(self, cache_path):
+        """Test clear removes all entries."""
+        cache = DiskCache(cache_path)
+        await cache.set("a", "1")
+        cache.clear()
+
+        assert await cache.get("a") is None
+        cache.close()
@@ -184,6 +184,14 @@ class TestSpecificErrors:
         
         assert error.context.category == ErrorCategory.NETWORK
         assert error.context.metadata["retry_after"] == 60
+        assert error.retry_after == 60
+    
+    def test_rate_limit_error_default_retry_after(self):
+        """Test RateLimitError falls back to a default retry_after."""
+        error = RateLimitError("Rate limit exceeded")
+        
+        assert error.retry_after == 60
+        assert error.context.metadata is None
     
     def test_timeout_error(self):
         """Test TimeoutError."""
@@ -0,0 +1,37 @@
+"""
+Unit tests for the monitoring package's lazy exports.
+"""
+
+import importlib
+import types
+
+import pytest
+
+from src.browserbot import monitoring
+
+
+@pytest.mark.unit
+class TestMonitoringExports:
+    """Test the package keeps exporting the ObservabilityManager instance."""
+
+    def test_submodule_binding_keeps_instance(self, monkeypatch):
+        """Test binding the submodule on the package exposes its instance instead."""
+        # Restores (or removes) the real binding afterwards
+        monkeypatch.setitem(monitoring.__dict__, "observability", None)
+        submodule = types.ModuleType("observability")
+        submodule.observability = manager = object()
+
+        # What the import system does once the submodule has loaded
+        setattr(monitoring, "observability", submodule)
+
+        assert monitoring.observability is manager
+
+    def test_submodule_imported_first(self):
+        """Test importing the submodule directly before the package attribute."""
+        pytest.importorskip("opentelemetry.exporter.otlp.proto.grpc.trace_exporter")
+        module = importlib.import_module("src.browserbot.monitoring.observability")
+
+        from src.browserbot.monitoring import observability
+
+        assert isinstance(observability, module.ObservabilityManager)
+        assert monitoring.observability is module.observability
@@ -0,0 +1,116 @@
+"""
+Unit tests for retry helpers.
+"""
+
+import pytest
+
+from src.browserbot.core import retry
+from src.browserbot.core.errors import CircuitBreakerOpenError
+from src.browserbot.core.retry import CircuitBreaker, CircuitBreakerConfig, RetryableOperation
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip real backoff delays."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.mark.unit
+class TestRetryableOperation:
+    """Test RetryableOperation iteration and backoff."""
+
+    async def test_retries_until_success(self, no_sleep):
+        """Test failed attempts are retried with backoff."""
+        attempts = []
+
+        async with RetryableOperation(max_attempts=3, base_delay=1.0) as op:
+            async for attempt in op:
+                with op:
+                    attempts.append(attempt)
+                    if attempt < 3:
+                        raise RuntimeError("flaky")
+
+        assert attempts == [1, 2, 3]
+        assert op.last_exception is None
+        assert len(no_sleep) == 2
+
+    async def test_exhausted_attempts_record_last_exception(self):
+        """Test the final failure is recorded once attempts run out."""
+        async with RetryableOperation(max_attempts=2) as op:
+            async for _ in op:
+                with op:
+                    raise ValueError("always")
+
+        assert isinstance(op.last_exception, ValueError)
+        assert op.attempt == 1
+
+    def test_exponential_delay_is_capped_and_jittered(self):
+        """Test exponential delay respects the cap and jitter bounds."""
+        op = RetryableOperation(base_delay=1.0, cap_delay=8.0, jitter=(0.5, 1.5))
+
+        op.attempt = 2
+        assert 2.0 <= op.next_delay() <= 6.0
+
+        op.attempt = 10
+        assert 4.0 <= op.next_delay() <= 12.0
+
+    def test_unknown_backoff(self):
+        """Test an unknown backoff strategy is rejected."""
+        with pytest.raises(ValueError):
+            RetryableOperation(backoff="linear")
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Test CircuitBreaker state helpers."""
+
+    def test_opens_at_threshold(self):
+        """Test is_open only reports True once failures reach the threshold."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60))
+
+        breaker.record_failure()
+        assert not breaker.is_open()
+
+        breaker.record_failure()
+        assert breaker.is_open()
+
+    def test_allows_probe_after_recovery_timeout(self):
+        """Test an open breaker stops rejecting once recovery is due."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0))
+
+        breaker.record_failure()
+
+        assert not breaker.is_open()
+
+    def test_success_closes(self):
+        """Test a recorded success resets the failure count."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, recovery_timeout=60))
+
+        breaker.record_failure()
+        breaker.record_success()
+
+        assert not breaker.is_open()
+        assert breaker.state.failure_count == 0
+
+    async def test_rejects_calls_while_open(self):
+        """Test calls fail fast with CircuitBreakerOpenError once open."""
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, recovery_timeout=60))
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            await breaker.async_call(call)
+        with pytest.raises(CircuitBreakerOpenError, match="Circuit breaker is OPEN"):
+            await breaker.async_call(call)
+
+        assert calls == 1
@@ -0,0 +1,53 @@
+"""
+Unit tests for the semantic cache.
+"""
+
+import pytest
+
+from src.browserbot.core.semantic_cache import SemanticCache
+
+# Tiny fixed "embeddings" so similarity is predictable
+VECTORS = {
+    "what is python": [1.0, 0.0, 0.0],
+    "explain python": [0.95, 0.3, 0.0],
+    "weather in paris": [0.0, 0.0, 1.0],
+}
+
+
+def encode(text):
+    return VECTORS[text]
+
+
+@pytest.mark.unit
+class TestSemanticCache:
+    """Test SemanticCache functionality."""
+
+    async def test_similar_prompt_hits(self):
+        """Test a paraphrased prompt returns the stored value."""
+        cache = SemanticCache(threshold=0.9, encoder=encode)
+        await cache.store("ns", "what is python", "answer")
+
+        assert await cache.lookup("ns", "explain python") == "answer"
+        assert await cache.lookup("ns", "weather in paris") is None
+
+    async def test_namespaces_are_isolated(self):
+        """Test prompts are only compared within the same namespace."""
+        cache = SemanticCache(encoder=encode)
+        await cache.store("ns", "what is python", "answer")
+
+        assert await cache.lookup("other", "what is python") is None
+
+    async def test_evicts_oldest(self):
+        """Test the oldest entry is dropped once maxsize is exceeded."""
+        cache = SemanticCache(maxsize=1, encoder=encode)
+        await cache.store("a", "what is python", 1)
+        await cache.store("b", "weather in paris", 2)
+
+        assert len(cache) == 1
+        assert await cache.lookup("a", "what is python") is None
+        assert await cache.lookup("b", "weather in paris") == 2
+
+    def test_invalid_threshold(self):
+        """Test thresholds outside (0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            SemanticCache(threshold=0)
@@ -0,0 +1,55 @@
+"""
+Unit tests for the TTL cache.
+"""
+
+import pytest
+
+from src.browserbot.core import ttl_cache
+from src.browserbot.core.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock."""
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test TTLCache functionality."""
+
+    def test_get_and_put(self, clock):
+        """Test basic storage and lookup."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_expiry_keeps_stale_value(self, clock):
+        """Test expired entries are only available through get_stale."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.put("a", 1)
+
+        clock[0] += 11
+
+        assert cache.get("a") is None
+        assert cache.get_stale("a") == 1
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock):
+        """Test least recently used entry is evicted first."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stale("b") == 2